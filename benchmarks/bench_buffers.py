@@ -0,0 +1,49 @@
+"""Bounds and MultipleOf over 10M-element buffers.
+
+python benchmarks/bench_buffers.py [n]
+"""
+
+import sys
+import time
+from array import array
+from typing import Annotated
+
+import annotated_types as at
+from typeguard import check_type
+
+import typeguard_annotatedtypes_plugin  # noqa: F401
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+
+CASES = {
+    "array('q') Ge(0) Lt(1000)": (
+        array("q", range(1000)) * (N // 1000),
+        Annotated[array, at.Ge(0), at.Lt(1000)],
+    ),
+    "array('d') Interval(ge=0, le=1)": (
+        array("d", [0.5]) * N,
+        Annotated[array, at.Interval(ge=0, le=1)],
+    ),
+    "memoryview('B') Lt(128)": (
+        memoryview(bytes(range(128)) * (N // 128)),
+        Annotated[memoryview, at.Lt(128)],
+    ),
+    "array('q') MultipleOf(2)": (
+        array("q", range(0, 2000, 2)) * (N // 1000),
+        Annotated[array, at.MultipleOf(2)],
+    ),
+}
+
+
+def main() -> None:
+    for name, (value, annotation) in CASES.items():
+        start = time.perf_counter()
+        check_type(value, annotation)
+        seconds = time.perf_counter() - start
+        print(
+            f"{name:>32}: {seconds * 1e3:8.1f} ms ({seconds / len(value) * 1e9:.1f} ns/element)"
+        )
+
+
+if __name__ == "__main__":
+    main()
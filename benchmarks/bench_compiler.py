@@ -0,0 +1,31 @@
+"""Per-value cost of the fused checker vs. the generated validator.
+
+python benchmarks/bench_compiler.py
+"""
+
+import functools
+import timeit
+
+import annotated_types as at
+
+from typeguard_annotatedtypes_plugin import check_constraints, check_ge, check_lt
+from typeguard_annotatedtypes_plugin.compiler import compile_constraints
+
+CONSTRAINTS = ((check_ge.__wrapped__, at.Ge(0)), (check_lt.__wrapped__, at.Lt(100)))
+
+
+def main() -> None:
+    number = 1_000_000
+    fused = functools.partial(check_constraints, constraints=CONSTRAINTS)
+    compiled = compile_constraints(int, CONSTRAINTS)
+    for name, checker in (("fused", fused), ("compiled", compiled)):
+        seconds = min(
+            timeit.repeat(
+                lambda c=checker: c(42, int, (), None), number=number, repeat=5
+            )
+        )
+        print(f"{name:>8}: {seconds / number * 1e9:8.1f} ns/value")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Overhead of the plugin on annotations without `Annotated` metadata.
+
+python benchmarks/bench_fast_reject.py
+"""
+
+import timeit
+from typing import Dict, List, Optional
+
+from typeguard import check_type, checker_lookup_functions
+
+from typeguard_annotatedtypes_plugin import plugin_lookup
+
+CASES = [
+    (1, int),
+    (["a", "b"], List[str]),
+    ({"a": 1}, Dict[str, int]),
+    (None, Optional[int]),
+]
+
+
+def run(number: int) -> float:
+    def work():
+        for value, annotation in CASES:
+            check_type(value, annotation)
+
+    best = min(timeit.repeat(work, number=number, repeat=5))
+    return best / number / len(CASES)
+
+
+def main() -> None:
+    number = 10_000
+    with_plugin = run(number)
+    checker_lookup_functions.remove(plugin_lookup)
+    try:
+        without_plugin = run(number)
+    finally:
+        checker_lookup_functions.insert(0, plugin_lookup)
+    print(f"without plugin: {without_plugin * 1e9:8.1f} ns/check")
+    print(f"with plugin:    {with_plugin * 1e9:8.1f} ns/check")
+    print(f"overhead:       {(with_plugin - without_plugin) * 1e9:8.1f} ns/check")
+    seconds = timeit.timeit(lambda: plugin_lookup(int, (), ()), number=number)
+    print(f"plugin_lookup(int, (), ()): {seconds / number * 1e9:8.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
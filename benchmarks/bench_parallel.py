@@ -0,0 +1,40 @@
+"""Serial vs parallel checking of a large list on the bulk path.
+
+python benchmarks/bench_parallel.py
+"""
+
+import timeit
+from typing import List
+
+import annotated_types as at
+from typeguard import CollectionCheckStrategy, check_type
+
+import typeguard_annotatedtypes_plugin  # noqa: F401
+from typeguard_annotatedtypes_plugin.parallel import use_parallel_validation
+
+ANNOTATION = List[at.IsAscii[str]]
+VALUES = [f"identifier_{i}" for i in range(2_000_000)]
+
+
+def check_all_items() -> None:
+    # typeguard's default FIRST_ITEM strategy would check only the first element
+    check_type(
+        VALUES, ANNOTATION, collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS
+    )
+
+
+def run(mode) -> float:
+    use_parallel_validation(mode, min_size=100_000)
+    try:
+        return min(timeit.repeat(check_all_items, number=1, repeat=5))
+    finally:
+        use_parallel_validation(None)
+
+
+def main() -> None:
+    for mode in (None, "thread", "process"):
+        print(f"{mode or 'serial':>8}: {run(mode) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
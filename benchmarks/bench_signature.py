@@ -0,0 +1,67 @@
+"""Per-call cost of @typechecked vs. compile_signature for 1, 5 and 15 constrained parameters.
+
+python benchmarks/bench_signature.py
+"""
+
+import timeit
+from typing import Annotated
+
+import annotated_types as at
+from typeguard import typechecked
+
+import typeguard_annotatedtypes_plugin  # noqa: F401
+from typeguard_annotatedtypes_plugin.signature import compile_signature
+
+Percent = Annotated[int, at.Ge(0), at.Le(100)]
+
+
+def func1(p0: Percent) -> None:
+    pass
+
+
+def func5(p0: Percent, p1: Percent, p2: Percent, p3: Percent, p4: Percent) -> None:
+    pass
+
+
+def func15(
+    p0: Percent,
+    p1: Percent,
+    p2: Percent,
+    p3: Percent,
+    p4: Percent,
+    p5: Percent,
+    p6: Percent,
+    p7: Percent,
+    p8: Percent,
+    p9: Percent,
+    p10: Percent,
+    p11: Percent,
+    p12: Percent,
+    p13: Percent,
+    p14: Percent,
+) -> None:
+    pass
+
+
+FUNCTIONS = {1: func1, 5: func5, 15: func15}
+
+
+def main() -> None:
+    number = 100_000
+    for arity, func in FUNCTIONS.items():
+        args = tuple(range(arity))
+        for name, decorated in (
+            ("plain", func),
+            ("typechecked", typechecked(func)),
+            ("compile_signature", compile_signature(func)),
+        ):
+            seconds = min(
+                timeit.repeat(lambda: decorated(*args), number=number, repeat=5)
+            )
+            print(
+                f"{arity:>2} params, {name:>17}: {seconds / number * 1e9:9.1f} ns/call"
+            )
+
+
+if __name__ == "__main__":
+    main()
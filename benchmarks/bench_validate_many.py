@@ -0,0 +1,34 @@
+"""validate_many vs. calling check_type for each value.
+
+python benchmarks/bench_validate_many.py
+"""
+
+import timeit
+from typing import Annotated
+
+import annotated_types as at
+from typeguard import check_type
+
+from typeguard_annotatedtypes_plugin.batch import validate_many
+
+Percent = Annotated[int, at.Ge(0), at.Le(100)]
+VALUES = [i % 101 for i in range(100_000)]
+
+
+def per_value() -> None:
+    for value in VALUES:
+        check_type(value, Percent)
+
+
+def batched() -> None:
+    validate_many(VALUES, Percent)
+
+
+def main() -> None:
+    for name, func in (("check_type per value", per_value), ("validate_many", batched)):
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{name:>20}: {seconds / len(VALUES) * 1e9:8.1f} ns/value")
+
+
+if __name__ == "__main__":
+    main()
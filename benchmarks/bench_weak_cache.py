@@ -0,0 +1,60 @@
+"""RSS while creating and discarding 100k distinct annotations, with and without the weak cache tier.
+
+python benchmarks/bench_weak_cache.py
+
+Each annotation is checked once and then dropped, like per-tenant limits built
+from configuration, and shares one module-level `Ge(0)` with all the others.
+With the weak tier, lookup results are freed along with their constraints, and
+the shared `Ge(0)` holds at most a few of them; without it, the LRU keeps the
+most recent `LOOKUP_CACHE_MAXSIZE` of them (and their constraints) alive. The
+weak tier needs constraint instances with a `__dict__` (annotated-types on
+Python 3.9).
+"""
+
+import gc
+import os
+import resource
+from typing import Annotated
+
+import annotated_types as at
+from typeguard import check_type
+
+from typeguard_annotatedtypes_plugin import (
+    annotated_type_lookup,
+    use_weak_lookup_cache,
+)
+
+COUNT = 100_000
+NON_NEGATIVE = at.Ge(0)
+
+
+def rss_mib() -> float:
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        # Peak rather than current RSS, in KiB on Linux and bytes on macOS
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+
+
+def run(weak: bool) -> None:
+    use_weak_lookup_cache(weak)
+    gc.collect()
+    print(f"weak tier {'on' if weak else 'off'}:")
+    for i in range(COUNT):
+        check_type(i, Annotated[int, NON_NEGATIVE, at.Le(i)])
+        if (i + 1) % (COUNT // 5) == 0:
+            print(f"  {i + 1:>7} annotations: {rss_mib():7.1f} MiB RSS")
+    print(f"  {annotated_type_lookup.weak_cache_info()}")
+    print(f"  {annotated_type_lookup.cache_info()}")
+    use_weak_lookup_cache(False)
+
+
+def main() -> None:
+    run(weak=False)
+    run(weak=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,43 @@
 import functools
-import typing
-from datetime import datetime, timezone
-from typing import Any, Callable, Optional, TypeVar, Union
+import os
+import sys
+import warnings
+from array import array
+from datetime import datetime, timezone, tzinfo
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 
 import annotated_types as at
 from typeguard import (
-    TypeCheckError,
     TypeCheckMemo,
+    TypeHintWarning,
     checker_lookup_functions,
 )
 
-from .util import print_input_output
+from .bounds import BOUND_TYPES, Bounds, merge_bounds
+from .cache import (  # noqa: F401
+    InternTable,
+    lookup_cache,
+    pure_predicate,
+    weak_lookup_cache,
+)
+from .errors import ConstraintViolation, set_repr_limits  # noqa: F401
+from .sampling import Sample, split_sample, use_sampling  # noqa: F401
+from .util import (  # noqa: F401
+    disable_tracing,
+    enable_tracing,
+    external_stacklevel,
+    trace_input_output,
+)
 
 # HashableNot = dataclass(Not, frozen=True)
 
@@ -61,6 +88,8 @@ TYPE_CONSTRAINTS = (
 
 R = TypeVar("R")
 
+AnnotatedAlias = type(Annotated[int, None])
+
 
 # def partial(func: Callable[..., R], *args: Any, **kwargs: Any):
 #     partial_function: functools.partial[R] = functools.partial(func, *args, **kwargs)
@@ -98,21 +127,28 @@ def type_checker(checker):
         #     memo
         # )
         if not isinstance(value, origin_type):
-            raise TypeCheckError(
-                f"{value!r} is not an instance of {origin_type.__name__}"
-            )
+            raise ConstraintViolation(value, origin_type)
         try:
             check_ok = checker(value, origin_type, args, memo, constraint)
         except Exception as e:
-            raise TypeCheckError(f"with value={value!r} raised an error: {e!r}")
+            raise ConstraintViolation(value, origin_type, constraint, e)
         else:
             if not check_ok:
-                raise TypeCheckError(f"with value={value!r} failed {constraint}")
+                raise ConstraintViolation(
+                    value, origin_type, failed_constraint(constraint, value)
+                )
             return True
 
     return wrapper
 
 
+def failed_constraint(constraint, value):
+    """The constraint to name in a failure; merged `Bounds` name the violated side."""
+    if isinstance(constraint, Bounds):
+        return constraint.violated_by(value)
+    return constraint
+
+
 @type_checker
 def check_gt(
     value,
@@ -157,6 +193,17 @@ def check_le(
     return value <= constraint.le
 
 
+@type_checker
+def check_bounds(
+    value: Any,
+    origin_type: Any,
+    args: tuple[Any, ...],
+    memo: TypeCheckMemo,
+    constraint: Bounds,
+) -> bool:
+    return constraint.contains(value)
+
+
 @type_checker
 def check_multiple_of(
     value: Any,
@@ -169,6 +216,16 @@ def check_multiple_of(
     return value % constraint.multiple_of == 0
 
 
+def length_range(constraint: Union[slice, at.Len]) -> tuple[int, Optional[int]]:
+    """`(min_length, max_length)` of a `Len`, or of the legacy slice syntax."""
+    if isinstance(constraint, slice):
+        # The stop is exclusive
+        min_length = constraint.start or 0
+        max_length = None if constraint.stop is None else constraint.stop - 1
+        return min_length, max_length
+    return constraint.min_length, constraint.max_length
+
+
 @type_checker
 def check_len(
     value: Any,
@@ -177,16 +234,31 @@ def check_len(
     memo: TypeCheckMemo,
     constraint: Union[slice, at.Len],
 ) -> bool:
-    if isinstance(constraint, slice):
-        constraint = at.Len(constraint.start or 0, constraint.stop)
-    assert isinstance(constraint, at.Len)
-    if constraint.min_inclusive is None:
-        raise TypeError
-    if len(value) < constraint.min_inclusive:
-        return False
-    return not (
-        constraint.max_exclusive is not None and len(value) >= constraint.max_exclusive
-    )
+    min_length, max_length = length_range(constraint)
+    length = len(value)
+    return length >= min_length and (max_length is None or length <= max_length)
+
+
+@type_checker
+def check_min_len(
+    value: Any,
+    origin_type: Any,
+    args: tuple[Any, ...],
+    memo: TypeCheckMemo,
+    constraint: at.MinLen,
+) -> bool:
+    return len(value) >= constraint.min_length
+
+
+@type_checker
+def check_max_len(
+    value: Any,
+    origin_type: Any,
+    args: tuple[Any, ...],
+    memo: TypeCheckMemo,
+    constraint: at.MaxLen,
+) -> bool:
+    return len(value) <= constraint.max_length
 
 
 @type_checker
@@ -199,35 +271,94 @@ def check_timezone(
 ) -> None:
     assert isinstance(constraint, at.Timezone)
     assert isinstance(value, datetime)
-    if isinstance(constraint.tz, str):
-        return value.tzinfo is not None and constraint.tz == value.tzname()
-    elif isinstance(constraint.tz, timezone):
-        return value.tzinfo is not None and value.tzinfo == constraint.tz
-    elif constraint.tz is None:
-        return value.tzinfo is None
-    # ellipsis
+    return timezone_matcher(constraint.tz)(value)
+
+
+def _is_naive(value: datetime) -> bool:
+    return value.tzinfo is None
+
+
+def _is_aware(value: datetime) -> bool:
     return value.tzinfo is not None
 
 
-# @type_checker
+def _has_tzinfo(tz: tzinfo, value: datetime) -> bool:
+    return value.tzinfo is not None and value.tzinfo == tz
+
+
+def _has_zone_name(name: str, value: datetime) -> bool:
+    tz = value.tzinfo
+    if tz is None:
+        return False
+    # A fixed offset's name doesn't depend on the datetime; a zoneinfo.ZoneInfo
+    # matches by its key. Only other tzinfo classes need value.tzname().
+    if type(tz) is timezone:
+        return tz.tzname(None) == name
+    if getattr(tz, "key", None) == name:
+        return True
+    return value.tzname() == name
+
+
+# Bounded: the keys are user `tz`/`Timezone` objects, which may be built at runtime
+@functools.lru_cache(maxsize=1024)
+def timezone_matcher(tz: Any) -> Callable[[datetime], bool]:
+    """The check for `Timezone(tz)`, with the kind of `tz` decided once:
+    naive (None), any aware (...), a zone name (str) or a tzinfo to equal."""
+    if tz is None:
+        return _is_naive
+    if tz is Ellipsis:
+        return _is_aware
+    if isinstance(tz, str):
+        return functools.partial(_has_zone_name, tz)
+    return functools.partial(_has_tzinfo, tz)
+
+
+@functools.lru_cache(maxsize=1024)
+def specialized_timezone_checker(constraint: at.Timezone) -> CheckerFn:
+    matches = timezone_matcher(constraint.tz)
+
+    def check_timezone_matches(value, origin_type, args, memo, constraint) -> bool:
+        return matches(value)
+
+    return check_timezone_matches
+
+
+@type_checker
 def check_predicate(
     value: Any,
     origin_type: Any,
     args: tuple[Any, ...],
     memo: TypeCheckMemo,
     constraint: at.Predicate,
-) -> None:
-    try:
-        check_ok = constraint.func(value)
-        # check_ok = checker(value, origin_type, args, memo, constraint)
-    except Exception as e:
-        raise TypeCheckError(f"with {value=!r} raised an error: {e!r}") from None
-    else:
+) -> bool:
+    return constraint.func(value)
+
+
+def check_constraints(
+    value,
+    origin_type,
+    args,
+    memo,
+    *,
+    constraints: tuple[tuple[CheckerFn, Any], ...],
+) -> bool:
+    """Checks every `(checker, constraint)` pair with a single isinstance guard.
+
+    `constraints` holds the unwrapped checkers, so the `type_checker` wrapper
+    doesn't run once per constraint.
+    """
+    if not isinstance(value, origin_type):
+        raise ConstraintViolation(value, origin_type)
+    for checker, constraint in constraints:
+        try:
+            check_ok = checker(value, origin_type, args, memo, constraint)
+        except Exception as e:
+            raise ConstraintViolation(value, origin_type, constraint, e)
         if not check_ok:
-            raise TypeCheckError(f"with {value=!r} failed {constraint}")
-        return True
-    # assert isinstance(constraint, Predicate)
-    # return constraint.func(value)
+            raise ConstraintViolation(
+                value, origin_type, failed_constraint(constraint, value)
+            )
+    return True
 
 
 # endregion
@@ -237,72 +368,351 @@ VALIDATORS: dict[Any, CheckerFn] = {
     at.Lt: check_lt,
     at.Ge: check_ge,
     at.Le: check_le,
+    Bounds: check_bounds,
     at.MultipleOf: check_multiple_of,
-    # at.Predicate: check_predicate,
+    at.Predicate: check_predicate,
     at.Len: check_len,
+    at.MinLen: check_min_len,
+    at.MaxLen: check_max_len,
     at.Timezone: check_timezone,
     slice: check_len,
 }
 
 
-# @print_input_output
-def check_annotated_type(
-    value,
-    origin_type,
-    args,
-    memo,
-    *,
-    annotated_type,
-) -> None:
-    checker = VALIDATORS[type(annotated_type)]
-    checker(value, origin_type, args, memo, annotated_type)
+# Constraint class -> checker, built once at import. Classes in TYPE_CONSTRAINTS
+# without a validator map to None, so their subclasses also resolve to None.
+CONSTRAINT_DISPATCH: dict[type, Optional[CheckerFn]] = {
+    **{
+        constraint_type: VALIDATORS.get(constraint_type)
+        for constraint_type in TYPE_CONSTRAINTS
+        if isinstance(constraint_type, type)
+    },
+    **VALIDATORS,
+}
+
+# Concrete class -> checker, filled lazily by resolve_checker.
+_RESOLVED_DISPATCH: dict[type, Optional[CheckerFn]] = {}
 
 
-@print_input_output
+def resolve_checker(instance_type: type) -> Optional[CheckerFn]:
+    try:
+        return _RESOLVED_DISPATCH[instance_type]
+    except KeyError:
+        pass
+    checker = None
+    for base in instance_type.__mro__:
+        if base in CONSTRAINT_DISPATCH:
+            checker = CONSTRAINT_DISPATCH[base]
+            break
+    _RESOLVED_DISPATCH[instance_type] = checker
+    return checker
+
+
+@trace_input_output
 def match_annotated_type(origin_type, *instances) -> Optional[tuple]:
-    for annotated_type in TYPE_CONSTRAINTS:
-        if typing.get_origin(annotated_type) is typing.Annotated:
-            extras = typing.get_args(annotated_type)
-            predicate: Any = extras[1]
-            # annotated_type_extras: list[tuple[Constraint, ConstraintType]] = list(
-            #     filter(None, [match_annotated_type(extra) for extra in extras])
-            # )
-            # if not annotated_type_extras or len(annotated_type_extras) > 1:
-            #     raise NotImplementedError(
-            #         f"Don't know how to handle {annotated_type} with extras {extras}; "
-            #         "only one annotated_type extra is supported"
-            #     )
-            # return annotated_type_extras[0]
-            if isinstance(origin_type, predicate) or issubclass(origin_type, predicate):
-                return origin_type, predicate
-        if issubclass(origin_type, annotated_type):
-            return origin_type, annotated_type
-        assert not isinstance(origin_type, annotated_type), (
-            f"origin_type {origin_type} ({type(origin_type)}) is an instance of {annotated_type} ({type(annotated_type)}), "
-            "I assumed this can never happen"
+    matches = tuple(
+        (instance, checker)
+        for instance in instances
+        if (checker := resolve_checker(type(instance)))
+    )
+    return matches or None
+
+
+def is_grouped_metadata(instance) -> bool:
+    # Cheaper than isinstance() against the runtime-checkable GroupedMetadata protocol
+    return hasattr(type(instance), "__is_annotated_types_grouped_metadata__")
+
+
+def _flatten_grouped_metadata(grouped) -> tuple:
+    return tuple(
+        part
+        for item in grouped
+        for part in (
+            expand_grouped_metadata(item) if is_grouped_metadata(item) else (item,)
         )
-        for instance in instances:
-            instance_type = type(instance)
-            if issubclass(instance_type, annotated_type):
-                assert isinstance(instance, annotated_type), (
-                    "Well, the issubclass cant be replaced by isinstance"
-                )
-                return instance, annotated_type
-            assert not isinstance(instance_type, annotated_type), (
-                f"instance_type {instance_type} ({type(instance_type)}) is an instance of {annotated_type} ({type(annotated_type)}), "
-                "I assumed this can never happen"
+    )
+
+
+_cached_flatten_grouped_metadata = functools.lru_cache(maxsize=1024)(
+    _flatten_grouped_metadata
+)
+
+
+def expand_grouped_metadata(grouped) -> tuple:
+    """Recursively flattens a GroupedMetadata (e.g. `Interval`, `Len`) into its parts.
+
+    Flattened tuples are cached per (hashable) group, so `__iter__` runs once.
+    """
+    try:
+        return _cached_flatten_grouped_metadata(grouped)
+    except TypeError:
+        return _flatten_grouped_metadata(grouped)
+
+
+def expand_instances(instances: tuple) -> tuple:
+    if not any(is_grouped_metadata(instance) for instance in instances):
+        return instances
+    return tuple(
+        part
+        for instance in instances
+        for part in (
+            expand_grouped_metadata(instance)
+            if is_grouped_metadata(instance)
+            else (instance,)
+        )
+    )
+
+
+def normalize_constraints(
+    constraints: tuple[tuple[CheckerFn, Any], ...],
+) -> tuple[tuple[CheckerFn, Any], ...]:
+    """Merges all Gt/Ge/Lt/Le constraints into one `Bounds`, placed where the first was.
+
+    Bounds whose values can't be compared with each other are left as they are.
+    """
+    bound_constraints = [c for _, c in constraints if isinstance(c, BOUND_TYPES)]
+    if not bound_constraints or not (bounds := merge_bounds(bound_constraints)):
+        return constraints
+    normalized = []
+    for checker, constraint in constraints:
+        if not isinstance(constraint, BOUND_TYPES):
+            normalized.append((checker, constraint))
+        elif bounds is not None:
+            normalized.append((check_bounds.__wrapped__, bounds))
+            bounds = None
+    return tuple(normalized)
+
+
+def specialize_constraints(
+    constraints: tuple[tuple[CheckerFn, Any], ...],
+) -> tuple[tuple[CheckerFn, Any], ...]:
+    """Replaces generic checkers with ones prebuilt for their constraint
+    (currently `Timezone`)."""
+    return tuple(
+        (specialized_timezone_checker(constraint), constraint)
+        if checker is check_timezone.__wrapped__
+        else (checker, constraint)
+        for checker, constraint in constraints
+    )
+
+
+def is_ndarray_type(origin_type) -> bool:
+    # An ndarray annotation implies numpy is already imported; never import it here
+    numpy = sys.modules.get("numpy")
+    return (
+        numpy is not None
+        and isinstance(origin_type, type)
+        and issubclass(origin_type, numpy.ndarray)
+    )
+
+
+LOOKUP_CACHE_MAXSIZE = 1024
+
+COMPILE_VALIDATORS = os.environ.get("TYPEGUARD_ANNOTATEDTYPES_COMPILE", "0") != "0"
+
+
+def resolve_constraints(origin_type, args, extras) -> Optional[tuple]:
+    """Expands, matches and normalizes an annotation's metadata into
+    `(unwrapped checker, constraint)` pairs; None when nothing is checkable."""
+    annotated_types = None
+    instances = expand_instances((*args, *extras))
+    if not (annotated_types := match_annotated_type(origin_type, *instances)):
+        return None
+
+    constraints = specialize_constraints(
+        normalize_constraints(
+            tuple(
+                (checker.__wrapped__, constraint)
+                for constraint, checker in annotated_types
             )
+        )
+    )
+    for _, constraint in constraints:
+        if isinstance(constraint, Bounds) and not constraint.satisfiable:
+            name = getattr(origin_type, "__name__", origin_type)
+            metadata = ", ".join(map(repr, extras))
+            warnings.warn(
+                f"Annotated[{name}, {metadata}] has unsatisfiable bounds "
+                f"{constraint}; every value will fail",
+                TypeHintWarning,
+                stacklevel=external_stacklevel(),
+            )
+    return constraints
+
+
+WEAK_LOOKUP_CACHE = os.environ.get("TYPEGUARD_ANNOTATEDTYPES_WEAK_CACHE", "0") != "0"
+
+# annotated-types slots its constraints on Python 3.10+; they then can't hold
+# lookup results and the weak cache tier has no effect.
+SLOTTED_CONSTRAINTS = not hasattr(at.Ge(0), "__dict__")
+
+WEAK_CACHE_UNAVAILABLE = (
+    "annotated-types constraints are slotted on this Python and can't hold "
+    "lookup results; the weak cache tier has no effect and lookups go through the LRU"
+)
+
+if WEAK_LOOKUP_CACHE and SLOTTED_CONSTRAINTS:
+    warnings.warn(WEAK_CACHE_UNAVAILABLE, RuntimeWarning)
+
+
+def lookup_owner(extras: tuple) -> Optional[Any]:
+    """The constraint instance that holds an annotation's lookup results in the
+    weak cache tier, or None. Slotted instances (annotated-types on Python 3.10+)
+    can't hold them."""
+    if WEAK_LOOKUP_CACHE:
+        for extra in extras:
+            if (
+                isinstance(extra, at.BaseMetadata) or is_grouped_metadata(extra)
+            ) and hasattr(extra, "__dict__"):
+                return extra
     return None
 
 
-@print_input_output
+# Equal constraint plans share one checker, however many annotations declare them.
+# The checker's plan (e.g. `.keywords["constraints"]`) is then the canonical one.
+CHECKERS = InternTable()
+
+
+def plan_key(kind: str, constraints: tuple[tuple[CheckerFn, Any], ...]) -> tuple:
+    # Constraints compare equal across value types (Gt(-2) == Gt(-2.0)); their
+    # reprs keep such plans apart, so failures name the declared constraint.
+    return kind, constraints, tuple(repr(constraint) for _, constraint in constraints)
+
+
+@trace_input_output
+@weak_lookup_cache(lookup_owner)
+@lookup_cache(maxsize=LOOKUP_CACHE_MAXSIZE)
 def annotated_type_lookup(origin_type, args, extras):
-    annotated_type = None
-    if not (annotated_type := match_annotated_type(origin_type, *args, *extras)):
+    sample, rest = split_sample(extras)
+    if not rest and any(type(arg) is AnnotatedAlias for arg in args):
+        from .bulk import sequence_checker
+
+        if checker := CHECKERS.intern(
+            # args' repr tells List[Annotated[float, Gt(-2)]] from Gt(-2.0) ones
+            ("sequence", origin_type, args, repr(args), sample),
+            lambda: sequence_checker(origin_type, args, sample),
+        ):
+            return checker
+    if sample is not None:
+        raise TypeError(
+            f"{sample!r} can't be applied to {origin_type!r} with args {args!r} "
+            f"and metadata {rest!r}: it needs a List[X] or Tuple[X, ...] with "
+            "no other metadata, of Annotated elements with bulk-checkable "
+            "constraints"
+        )
+
+    if not (constraints := resolve_constraints(origin_type, args, extras)):
         return None
+    checker = constraints_checker(origin_type, constraints)
+    # The plugin's checker replaces typeguard's for the whole annotation, so it
+    # must also check what typeguard would, e.g. the items of a List[int].
+    if (check_args := type_args_checker(origin_type, args)) is None:
+        return checker
+    return CHECKERS.intern(
+        ("type args", check_args, checker),
+        lambda: functools.partial(
+            check_type_args_and_constraints, check_args=check_args, checker=checker
+        ),
+    )
 
-    constraint, _constraint_type = annotated_type
-    return functools.partial(check_annotated_type, annotated_type=constraint)
 
+def constraints_checker(
+    origin_type, constraints: tuple[tuple[CheckerFn, Any], ...]
+) -> Callable:
+    if is_ndarray_type(origin_type):
+        from .numpy_backend import ndarray_checker
 
-checker_lookup_functions.insert(0, annotated_type_lookup)
+        return CHECKERS.intern(
+            plan_key("ndarray", constraints), lambda: ndarray_checker(constraints)
+        )
+    if isinstance(origin_type, type) and issubclass(origin_type, (memoryview, array)):
+        from .buffer_backend import buffer_checker
+
+        return CHECKERS.intern(
+            plan_key("buffer", constraints), lambda: buffer_checker(constraints)
+        )
+    if COMPILE_VALIDATORS:
+        from .compiler import compile_constraints
+
+        return compile_constraints(origin_type, constraints)
+    # Not keyed on origin_type: check_constraints gets it from typeguard on each call
+    return CHECKERS.intern(
+        plan_key("constraints", constraints),
+        lambda: functools.partial(check_constraints, constraints=constraints),
+    )
+
+
+def type_args_checker(origin_type, args: tuple) -> Optional[Callable]:
+    """typeguard's own checker for `origin_type[args]`, from the lookup functions
+    other than this plugin's; None without args or without such a checker."""
+    if not args:
+        return None
+    for lookup in checker_lookup_functions:
+        if lookup is not plugin_lookup and (checker := lookup(origin_type, args, ())):
+            return checker
+    return None
+
+
+def check_type_args_and_constraints(
+    value, origin_type, args, memo, *, check_args: Callable, checker: Callable
+) -> bool:
+    check_args(value, origin_type, args, memo)
+    return checker(value, origin_type, args, memo)
+
+
+def use_compiled_validators(enabled: bool = True) -> None:
+    """Toggles the source-generating validator compiler (see `compiler.py`)."""
+    global COMPILE_VALIDATORS
+    COMPILE_VALIDATORS = enabled
+    annotated_type_lookup.cache_clear()
+
+
+def use_weak_lookup_cache(enabled: bool = True) -> None:
+    """Toggles the weak cache tier (see `cache.weak_lookup_cache`): lookups for
+    annotations built at runtime are then freed along with their constraints.
+
+    Enabling it warns with a `RuntimeWarning` where constraints are slotted
+    (annotated-types on Python 3.10+): there it has no effect, and lookups
+    stay in the bounded LRU.
+    """
+    if enabled and SLOTTED_CONSTRAINTS:
+        warnings.warn(WEAK_CACHE_UNAVAILABLE, RuntimeWarning, stacklevel=2)
+    global WEAK_LOOKUP_CACHE
+    WEAK_LOOKUP_CACHE = enabled
+    annotated_type_lookup.cache_clear()
+
+
+def plugin_lookup(origin_type, args, extras):
+    """The lookup hook registered with typeguard.
+
+    Rejects annotations without metadata, either their own or on an
+    `Annotated` type argument, before any tracing or caching runs.
+    """
+    if not extras:
+        for arg in args:
+            if type(arg) is AnnotatedAlias or resolve_checker(type(arg)):
+                break
+        else:
+            return None
+    return annotated_type_lookup(origin_type, args, extras)
+
+
+def split_annotation(annotation) -> tuple[Any, tuple, tuple]:
+    """Splits an annotation into the `(origin_type, args, extras)` that typeguard
+    passes to its checker lookup functions."""
+    extras: tuple = ()
+    origin_type = get_origin(annotation)
+    if origin_type is Annotated:
+        annotation, *extras_ = get_args(annotation)
+        extras = tuple(extras_)
+        origin_type = get_origin(annotation)
+    if origin_type is None:
+        return annotation, (), extras
+    args = get_args(annotation)
+    # Same tuple[()] compatibility hack as typeguard's check_type_internal
+    if origin_type in (tuple, Tuple) and annotation is not Tuple and not args:
+        args = ((),)
+    return origin_type, args, extras
+
+
+checker_lookup_functions.insert(0, plugin_lookup)
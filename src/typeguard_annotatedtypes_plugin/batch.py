@@ -0,0 +1,302 @@
+import asyncio
+import collections.abc
+import dataclasses
+import itertools
+import sys
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    Optional,
+    get_args,
+    get_origin,
+)
+
+from typeguard import (
+    CollectionCheckStrategy,
+    TypeCheckConfiguration,
+    TypeCheckError,
+    TypeCheckMemo,
+    check_type_internal,
+)
+
+from . import plugin_lookup, split_annotation
+
+ValueChecker = Callable[[Any], Any]
+
+STREAM_ORIGINS = (
+    collections.abc.Iterable,
+    collections.abc.Iterator,
+    collections.abc.Generator,
+    collections.abc.AsyncIterable,
+    collections.abc.AsyncIterator,
+    collections.abc.AsyncGenerator,
+)
+
+# Elements pulled from a stream per validation pass in `validate_stream`.
+STREAM_CHUNK_SIZE = 1024
+
+
+def resolve_value_checker(annotation: Any, memo: TypeCheckMemo) -> ValueChecker:
+    """Resolves `annotation` once into a callable that checks a single value.
+
+    Uses the plugin's checker when there is one, and `check_type_internal`
+    (with the same memo) otherwise.
+    """
+    origin_type, args, extras = split_annotation(annotation)
+    checker = plugin_lookup(origin_type, args, extras)
+    if checker is None:
+        return lambda value: check_type_internal(value, annotation, memo)
+    return lambda value: checker(value, origin_type, args, memo)
+
+
+def failure_indices(check: ValueChecker, values: Iterable[Any]) -> list[int]:
+    failures = []
+    for index, value in enumerate(values):
+        try:
+            check(value)
+        except TypeCheckError:
+            failures.append(index)
+    return failures
+
+
+def _memo(frame, config: Optional[TypeCheckConfiguration]) -> TypeCheckMemo:
+    return TypeCheckMemo(
+        frame.f_globals, frame.f_locals, config=config or TypeCheckConfiguration()
+    )
+
+
+def _chunk_memo(memo: TypeCheckMemo) -> TypeCheckMemo:
+    """`memo` with `ALL_ITEMS`, so a bulk chunk check neither samples nor stops
+    at the first element (see `sampling.active_sample`)."""
+    config = dataclasses.replace(
+        memo.config, collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS
+    )
+    return TypeCheckMemo(memo.globals, memo.locals, config=config)
+
+
+def validate_many(
+    values: Iterable[Any],
+    annotation: Any,
+    *,
+    mode: Literal["raise", "collect"] = "raise",
+    config: Optional[TypeCheckConfiguration] = None,
+) -> list[int]:
+    """Checks every value against `annotation`, resolving its checker only once.
+
+    With `mode="raise"`, the first failure raises a `TypeCheckError` whose path
+    names the item index. With `mode="collect"`, returns the indices of all
+    failing values (empty if all pass).
+    """
+    if mode not in ("raise", "collect"):
+        raise ValueError(f"Unknown mode: {mode!r}")
+    check = resolve_value_checker(annotation, _memo(sys._getframe(1), config))
+    index = 0
+    if mode == "raise":
+        try:
+            for index, value in enumerate(values):
+                check(value)
+        except TypeCheckError as exc:
+            exc.append_path_element(f"item {index}")
+            raise
+        return []
+    return failure_indices(check, values)
+
+
+def validate_columns(
+    columns: Mapping[str, Iterable[Any]],
+    schema: Mapping[str, Any],
+    *,
+    max_workers: Optional[int] = None,
+    config: Optional[TypeCheckConfiguration] = None,
+) -> dict[str, list[int]]:
+    """Validates a dict-of-lists record batch column by column.
+
+    `schema` maps column names to annotations. Each column's checker is
+    resolved once and the column is swept in a single pass. Returns the failing
+    row indices per schema column. With `max_workers`, columns are validated
+    concurrently on a thread pool.
+    """
+    missing = schema.keys() - columns.keys()
+    if missing:
+        raise KeyError(f"Columns missing from batch: {sorted(missing)}")
+    memo = _memo(sys._getframe(1), config)
+    checks = {
+        name: resolve_value_checker(annotation, memo)
+        for name, annotation in schema.items()
+    }
+    if not max_workers or max_workers <= 1:
+        return {
+            name: failure_indices(check, columns[name])
+            for name, check in checks.items()
+        }
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            name: executor.submit(failure_indices, check, columns[name])
+            for name, check in checks.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+def stream_element_annotation(annotation: Any) -> Any:
+    """`X` for `Iterator[X]`, `Generator[X, ...]`, their async forms etc.; else `annotation`."""
+    if get_origin(annotation) in STREAM_ORIGINS and get_args(annotation):
+        return get_args(annotation)[0]
+    return annotation
+
+
+def validate_stream(
+    values: Iterable[Any],
+    annotation: Any,
+    *,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    config: Optional[TypeCheckConfiguration] = None,
+) -> Iterator[Any]:
+    """Lazily checks the elements of a (possibly unbounded) stream.
+
+    `annotation` is the element annotation, or an `Iterator[X]`/`Iterable[X]`/
+    `Generator[X, ...]` annotation of the stream. Elements are pulled
+    `chunk_size` at a time, each chunk is checked (in bulk where the plugin
+    can) and its elements are yielded; only one chunk is held in memory. A failure
+    yields the elements before it, then raises a `TypeCheckError` whose path
+    names the item's position in the stream.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    element = stream_element_annotation(annotation)
+    memo = _memo(sys._getframe(1), config)
+    check = resolve_value_checker(element, memo)
+    # Where the plugin has a bulk checker for the element constraints, whole
+    # chunks go through it and the element checker only locates a failure.
+    chunk_checker = plugin_lookup(list, (element,), ())
+    return _stream(iter(values), chunk_size, chunk_checker, _chunk_memo(memo), check)
+
+
+def validate_async_stream(
+    values: AsyncIterable[Any],
+    annotation: Any,
+    *,
+    executor: Optional[Executor] = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    config: Optional[TypeCheckConfiguration] = None,
+) -> AsyncIterator[Any]:
+    """The async counterpart of `validate_stream`, for `AsyncIterator[X]` and the like.
+
+    Without `executor`, each element is checked as it arrives, with no extra
+    await. With `executor`, elements are gathered `chunk_size` at a time and
+    each chunk is checked on the executor, keeping expensive checks (e.g.
+    `Predicate`) off the event loop.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    element = stream_element_annotation(annotation)
+    memo = _memo(sys._getframe(1), config)
+    check = resolve_value_checker(element, memo)
+    if executor is None:
+        return _async_stream(values.__aiter__(), check)
+    chunk_checker = plugin_lookup(list, (element,), ())
+    return _async_chunked_stream(
+        values.__aiter__(),
+        executor,
+        chunk_size,
+        chunk_checker,
+        _chunk_memo(memo),
+        check,
+    )
+
+
+def _first_failure(
+    chunk: list,
+    offset: int,
+    chunk_checker: Optional[Callable],
+    memo: TypeCheckMemo,
+    check: ValueChecker,
+) -> Optional[tuple[int, TypeCheckError]]:
+    """The chunk index and error of the first failing element, or None."""
+    if chunk_checker is not None and _chunk_passes(chunk_checker, chunk, memo):
+        return None
+    for index, value in enumerate(chunk):
+        try:
+            check(value)
+        except TypeCheckError as exc:
+            exc.append_path_element(f"item {offset + index}")
+            return index, exc
+    return None
+
+
+def _chunk_passes(chunk_checker: Callable, chunk: list, memo: TypeCheckMemo) -> bool:
+    try:
+        chunk_checker(chunk, list, (), memo)
+    except TypeCheckError:
+        return False
+    return True
+
+
+def _stream(
+    values: Iterator[Any],
+    chunk_size: int,
+    chunk_checker: Optional[Callable],
+    memo: TypeCheckMemo,
+    check: ValueChecker,
+) -> Iterator[Any]:
+    offset = 0
+    while chunk := list(itertools.islice(values, chunk_size)):
+        failure = _first_failure(chunk, offset, chunk_checker, memo, check)
+        if failure is not None:
+            index, exc = failure
+            yield from chunk[:index]
+            raise exc
+        yield from chunk
+        offset += len(chunk)
+
+
+async def _async_stream(values: AsyncIterator[Any], check: ValueChecker):
+    index = 0
+    async for value in values:
+        try:
+            check(value)
+        except TypeCheckError as exc:
+            exc.append_path_element(f"item {index}")
+            raise
+        yield value
+        index += 1
+
+
+async def _async_chunked_stream(
+    values: AsyncIterator[Any],
+    executor: Executor,
+    chunk_size: int,
+    chunk_checker: Optional[Callable],
+    memo: TypeCheckMemo,
+    check: ValueChecker,
+):
+    loop = asyncio.get_running_loop()
+    offset = 0
+    exhausted = False
+    while not exhausted:
+        chunk = []
+        while len(chunk) < chunk_size:
+            try:
+                chunk.append(await values.__anext__())
+            except StopAsyncIteration:
+                exhausted = True
+                break
+        if not chunk:
+            break
+        failure = await loop.run_in_executor(
+            executor, _first_failure, chunk, offset, chunk_checker, memo, check
+        )
+        if failure is not None:
+            index, exc = failure
+            for value in chunk[:index]:
+                yield value
+            raise exc
+        for value in chunk:
+            yield value
+        offset += len(chunk)
@@ -0,0 +1,135 @@
+import functools
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Optional
+
+import annotated_types as at
+
+BOUND_TYPES = (at.Gt, at.Ge, at.Lt, at.Le)
+
+# (lower_inclusive, upper_inclusive) -> range test; None marks a missing side.
+_RANGE_TESTS: dict[tuple[Optional[bool], Optional[bool]], Callable] = {
+    (None, None): lambda lo, hi, v: True,
+    (False, None): lambda lo, hi, v: lo < v,
+    (True, None): lambda lo, hi, v: lo <= v,
+    (None, False): lambda lo, hi, v: v < hi,
+    (None, True): lambda lo, hi, v: v <= hi,
+    (False, False): lambda lo, hi, v: lo < v < hi,
+    (False, True): lambda lo, hi, v: lo < v <= hi,
+    (True, False): lambda lo, hi, v: lo <= v < hi,
+    (True, True): lambda lo, hi, v: lo <= v <= hi,
+}
+
+
+def _never(lo, hi, v) -> bool:
+    return False
+
+
+@dataclass(frozen=True)
+class Bounds:
+    """The Gt/Ge/Lt/Le constraints of one annotation, merged into the tightest range.
+
+    `lower_constraint`/`upper_constraint` are the original constraints the
+    bounds came from, so failures can name them.
+    """
+
+    lower_constraint: Optional[Any] = None
+    upper_constraint: Optional[Any] = None
+    lower: Any = field(init=False, compare=False)
+    upper: Any = field(init=False, compare=False)
+    lower_inclusive: Optional[bool] = field(init=False, compare=False)
+    upper_inclusive: Optional[bool] = field(init=False, compare=False)
+    satisfiable: bool = field(init=False, compare=False)
+    _test: Callable = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        set_field = functools.partial(object.__setattr__, self)
+        set_field("lower", bound_value(self.lower_constraint))
+        set_field("upper", bound_value(self.upper_constraint))
+        set_field("lower_inclusive", inclusive(self.lower_constraint))
+        set_field("upper_inclusive", inclusive(self.upper_constraint))
+        set_field("satisfiable", self._is_satisfiable())
+        if self.satisfiable:
+            set_field(
+                "_test", _RANGE_TESTS[(self.lower_inclusive, self.upper_inclusive)]
+            )
+        else:
+            set_field("_test", _never)
+
+    def _is_satisfiable(self) -> bool:
+        if self.lower_constraint is None or self.upper_constraint is None:
+            return True
+        if self.lower_inclusive and self.upper_inclusive:
+            return self.lower <= self.upper
+        return self.lower < self.upper
+
+    def contains(self, value) -> bool:
+        return self._test(self.lower, self.upper, value)
+
+    def violated_by(self, value) -> Any:
+        """The original constraint `value` fails; the lower bound is checked first."""
+        if self.lower_constraint is not None:
+            in_lower = _RANGE_TESTS[(self.lower_inclusive, None)]
+            if not in_lower(self.lower, None, value):
+                return self.lower_constraint
+        return self.upper_constraint
+
+    def __str__(self) -> str:
+        constraints = (self.lower_constraint, self.upper_constraint)
+        return ", ".join(str(c) for c in constraints if c is not None)
+
+
+def bound_value(constraint: Any) -> Any:
+    if constraint is None:
+        return None
+    if isinstance(constraint, at.Gt):
+        return constraint.gt
+    if isinstance(constraint, at.Ge):
+        return constraint.ge
+    if isinstance(constraint, at.Lt):
+        return constraint.lt
+    return constraint.le
+
+
+def inclusive(constraint: Any) -> Optional[bool]:
+    if constraint is None:
+        return None
+    return isinstance(constraint, (at.Ge, at.Le))
+
+
+def _tighter_lower(current: Any, candidate: Any) -> Any:
+    if current is None:
+        return candidate
+    current_value, candidate_value = bound_value(current), bound_value(candidate)
+    if candidate_value > current_value:
+        return candidate
+    if candidate_value == current_value and not inclusive(candidate):
+        return candidate
+    return current
+
+
+def _tighter_upper(current: Any, candidate: Any) -> Any:
+    if current is None:
+        return candidate
+    current_value, candidate_value = bound_value(current), bound_value(candidate)
+    if candidate_value < current_value:
+        return candidate
+    if candidate_value == current_value and not inclusive(candidate):
+        return candidate
+    return current
+
+
+def merge_bounds(constraints: Iterable[Any]) -> Optional[Bounds]:
+    """Merges Gt/Ge/Lt/Le constraints into one `Bounds`, keeping the tightest of each side.
+
+    Returns None when the bound values can't be compared with each other.
+    """
+    lower = upper = None
+    try:
+        for constraint in constraints:
+            if isinstance(constraint, (at.Gt, at.Ge)):
+                lower = _tighter_lower(lower, constraint)
+            else:
+                upper = _tighter_upper(upper, constraint)
+        return Bounds(lower, upper)
+    except TypeError:
+        return None
@@ -0,0 +1,120 @@
+"""Element-wise checks for `Annotated[memoryview, ...]` and `Annotated[array.array, ...]`.
+
+Bounds and `MultipleOf` apply to the buffer's elements, read in place
+through the buffer protocol; the buffer is never copied into a list.
+`MinLen`/`MaxLen` apply to `len(value)` and other constraints to the
+buffer as a whole.
+"""
+
+import functools
+import itertools
+import math
+import operator
+import struct
+from array import array
+from typing import Any, Callable, Optional, Union
+
+import annotated_types as at
+
+from . import check_bounds, check_multiple_of
+from .bounds import Bounds
+from .kernels import Kernel, check_kernels, whole_value_kernel
+
+Buffer = Union[memoryview, array]
+
+INTEGER_FORMATS = frozenset("bBhHiIlLqQnN")
+FLOAT_FORMATS = frozenset("efd")
+
+
+def element_format(value: Buffer) -> str:
+    fmt = value.typecode if isinstance(value, array) else value.format
+    fmt = fmt.lstrip("@=<>!")
+    if fmt not in INTEGER_FORMATS and fmt not in FLOAT_FORMATS:
+        raise TypeError(f"unsupported buffer format {fmt!r}")
+    return fmt
+
+
+def elements(value: Buffer) -> Buffer:
+    """A flat view of the buffer's elements; never copies."""
+    if isinstance(value, memoryview) and value.ndim != 1:
+        return value.cast("B").cast(value.format)
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def integer_range(fmt: str) -> tuple[int, int]:
+    bits = struct.calcsize(fmt) * 8
+    if fmt.islower():
+        return -(2 ** (bits - 1)), 2 ** (bits - 1) - 1
+    return 0, 2**bits - 1
+
+
+def first_failing(value: Buffer, passes: Callable[[Any], bool]) -> Any:
+    """Index of the first failing element; a tuple for multi-dimensional views."""
+    flat_index = next(
+        i for i, element in enumerate(elements(value)) if not passes(element)
+    )
+    if isinstance(value, array) or value.ndim == 1:
+        return flat_index
+    index = []
+    for size in reversed(value.shape):
+        flat_index, i = divmod(flat_index, size)
+        index.append(i)
+    return tuple(reversed(index))
+
+
+def bounds_kernel(bounds: Bounds) -> Kernel:
+    def kernel(value: Buffer) -> Optional[int]:
+        fmt = element_format(value)
+        values = elements(value)
+        if not len(values):
+            return None
+        if bounds.satisfiable:
+            check_lower = bounds.lower_constraint is not None
+            check_upper = bounds.upper_constraint is not None
+            if fmt in INTEGER_FORMATS:
+                # Skip the sides the element type can't violate, e.g. Ge(0) on "B"
+                lowest, highest = integer_range(fmt)
+                check_lower = check_lower and not bounds.contains(lowest)
+                check_upper = check_upper and not bounds.contains(highest)
+            # min()/max() iterate the buffer in C. NaN can hide from them, so
+            # float buffers get one more C-level pass for it.
+            if (
+                (not check_lower or bounds.contains(min(values)))
+                and (not check_upper or bounds.contains(max(values)))
+                and not (fmt in FLOAT_FORMATS and any(map(math.isnan, values)))
+            ):
+                return None
+        return first_failing(value, bounds.contains)
+
+    return kernel
+
+
+def multiple_of_kernel(constraint: at.MultipleOf) -> Kernel:
+    multiple_of = constraint.multiple_of
+
+    def kernel(value: Buffer) -> Optional[int]:
+        element_format(value)
+        values = elements(value)
+        # map() drives the loop in C; any() stops at the first nonzero remainder
+        if not any(map(operator.mod, values, itertools.repeat(multiple_of))):
+            return None
+        return first_failing(value, lambda element: element % multiple_of == 0)
+
+    return kernel
+
+
+def make_kernel(checker: Callable, constraint: Any) -> Kernel:
+    if checker is check_bounds.__wrapped__:
+        return bounds_kernel(constraint)
+    if checker is check_multiple_of.__wrapped__:
+        return multiple_of_kernel(constraint)
+    return whole_value_kernel(checker, constraint)
+
+
+def buffer_checker(constraints: tuple[tuple[Callable, Any], ...]):
+    kernels = tuple(
+        (make_kernel(checker, constraint), constraint)
+        for checker, constraint in constraints
+    )
+    return functools.partial(check_kernels, kernels=kernels)
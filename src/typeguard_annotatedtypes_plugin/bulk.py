@@ -0,0 +1,309 @@
+"""Collection-level fast paths for sequences of `Annotated` elements.
+
+For `List[X]` and `Tuple[X, ...]` where `X` is `Annotated[...]`, the whole
+sequence is validated by one checker: element types and each element
+constraint are checked in a single C-driven loop per constraint, instead of
+one typeguard lookup and checker call per element. Only constraint families
+with a bulk kernel take this path; anything else is left to typeguard.
+A `Sample` (see `sampling.py`) limits the check to some of the elements.
+"""
+
+import decimal
+import fractions
+import functools
+import itertools
+import math
+import operator
+import sys
+from datetime import date, datetime
+from typing import Any, Callable, Optional, Sequence
+
+import annotated_types as at
+
+from . import (
+    AnnotatedAlias,
+    check_bounds,
+    check_len,
+    check_max_len,
+    check_min_len,
+    check_multiple_of,
+    check_predicate,
+    failed_constraint,
+    length_range,
+    parallel,
+    resolve_constraints,
+    split_annotation,
+    timezone_matcher,
+)
+from .bounds import Bounds
+from .errors import ConstraintViolation
+from .kernels import Kernel
+from .parallel import Failure
+from .sampling import Sample, active_sample
+
+# Like typeguard, accept ints where floats are expected, and both for complex.
+NUMERIC_TOWER: dict[type, tuple[type, ...]] = {
+    float: (float, int),
+    complex: (complex, float, int),
+}
+
+# IsFinite/IsNan/IsInfinite (and IsNot*) are Predicate(func) / Predicate(Not(func))
+FLOAT_CLASS_FUNCS = frozenset({math.isfinite, math.isnan, math.isinf})
+
+# LowerCase/UpperCase/IsDigit/IsAscii are Predicate(str.<method>); bytes and
+# bytearray elements use their own method of the same name.
+STRING_PREDICATES = frozenset({str.islower, str.isupper, str.isdigit, str.isascii})
+STRING_TYPES = (str, bytes, bytearray)
+
+# Element types whose order is total, so min()/max() bound every element.
+# Subclasses may redefine comparisons, so only these exact types qualify.
+TOTALLY_ORDERED = frozenset(
+    {int, float, decimal.Decimal, fractions.Fraction, str, bytes, date, datetime}
+)
+
+# Below this length, converting to an ndarray costs more than it saves.
+NUMPY_THRESHOLD = 4096
+
+
+def element_annotation(origin_type: Any, args: tuple) -> Optional[Any]:
+    if origin_type is list and len(args) == 1:
+        return args[0]
+    if origin_type is tuple and len(args) == 2 and args[1] is Ellipsis:
+        return args[0]
+    return None
+
+
+def first_failing(values: Sequence, passes: Callable[[Any], Any]) -> int:
+    return next(i for i, value in enumerate(values) if not passes(value))
+
+
+def float_class_kernel(func: Callable[[float], bool], negate: bool) -> Kernel:
+    def kernel(values: Sequence) -> Optional[int]:
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and len(values) >= NUMPY_THRESHOLD:
+            ufunc = getattr(numpy, func.__name__)
+            mask = ufunc(numpy.fromiter(values, dtype=float, count=len(values)))
+            if negate:
+                mask = ~mask
+            return None if mask.all() else int(numpy.argmin(mask))
+        # math.isfinite etc. are called directly by map(), with no Predicate indirection
+        if negate:
+            if not any(map(func, values)):
+                return None
+            return first_failing(values, lambda value: not func(value))
+        if all(map(func, values)):
+            return None
+        return first_failing(values, func)
+
+    return kernel
+
+
+def map_kernel(passes: Callable[[Any], bool]) -> Kernel:
+    def kernel(values: Sequence) -> Optional[int]:
+        # map() drives the loop; C-level methods run with no Python frame per element
+        if all(map(passes, values)):
+            return None
+        return first_failing(values, passes)
+
+    return kernel
+
+
+def bounds_kernel(bounds: Bounds, element_type: type) -> Kernel:
+    if element_type not in TOTALLY_ORDERED:
+        # e.g. frozensets: the smallest and largest can pass while others fail
+        return map_kernel(bounds.contains)
+    check_nan = element_type is float
+
+    def kernel(values: Sequence) -> Optional[int]:
+        # min()/max() compare in C. NaN can hide from them, so float elements
+        # get one more C-level pass for it (NaN is the only value != itself).
+        if (
+            bounds.satisfiable
+            and (bounds.lower_constraint is None or bounds.contains(min(values)))
+            and (bounds.upper_constraint is None or bounds.contains(max(values)))
+            and not (check_nan and not all(map(operator.eq, values, values)))
+        ):
+            return None
+        return first_failing(values, bounds.contains)
+
+    return kernel
+
+
+def multiple_of_kernel(constraint: at.MultipleOf) -> Kernel:
+    multiple_of = constraint.multiple_of
+
+    def kernel(values: Sequence) -> Optional[int]:
+        # map() drives the loop in C; any() stops at the first nonzero remainder
+        if not any(map(operator.mod, values, itertools.repeat(multiple_of))):
+            return None
+        return first_failing(values, lambda value: value % multiple_of == 0)
+
+    return kernel
+
+
+def length_kernel(min_length: int, max_length: Optional[int]) -> Kernel:
+    def passes(value: Any) -> bool:
+        length = len(value)
+        return min_length <= length and (max_length is None or length <= max_length)
+
+    def kernel(values: Sequence) -> Optional[int]:
+        lengths = list(map(len, values))
+        if min(lengths) >= min_length and (
+            max_length is None or max(lengths) <= max_length
+        ):
+            return None
+        return first_failing(values, passes)
+
+    return kernel
+
+
+def element_kernel(
+    checker: Callable, constraint: Any, element_type: type
+) -> Optional[Kernel]:
+    """A bulk kernel for one element constraint, or None if there isn't one."""
+    if isinstance(constraint, at.Timezone):
+        return map_kernel(timezone_matcher(constraint.tz))
+    if checker is check_bounds.__wrapped__:
+        return bounds_kernel(constraint, element_type)
+    if checker is check_multiple_of.__wrapped__:
+        return multiple_of_kernel(constraint)
+    if checker is check_min_len.__wrapped__:
+        return length_kernel(constraint.min_length, None)
+    if checker is check_max_len.__wrapped__:
+        return length_kernel(0, constraint.max_length)
+    if checker is check_len.__wrapped__:
+        return length_kernel(*length_range(constraint))
+    if checker is not check_predicate.__wrapped__:
+        return None
+    func, negate = constraint.func, False
+    if isinstance(func, at.Not):
+        func, negate = func.func, True
+    if func in FLOAT_CLASS_FUNCS:
+        return float_class_kernel(func, negate)
+    if func in STRING_PREDICATES and not negate:
+        for string_type in STRING_TYPES:
+            if issubclass(element_type, string_type):
+                return map_kernel(getattr(string_type, func.__name__))
+    return None
+
+
+def first_non_instance(values: Sequence, types: tuple[type, ...]) -> Optional[int]:
+    if all(map(isinstance, values, itertools.repeat(types))):
+        return None
+    return first_failing(values, lambda value: isinstance(value, types))
+
+
+def sequence_failure(
+    values: Sequence,
+    accepted_types: tuple[type, ...],
+    kernels: tuple[tuple[Kernel, Any], ...],
+) -> Optional[Failure]:
+    """The lowest-index failure in `values`, as (index, kernel position, error).
+
+    The position is None for an element of the wrong type. A kernel that raises
+    fails the whole sequence, with index None.
+    """
+    failure = None
+    if (index := first_non_instance(values, accepted_types)) is not None:
+        failure, values = (index, None, None), values[:index]
+    for position, (kernel, _) in enumerate(kernels):
+        if not values:
+            break
+        try:
+            index = kernel(values)
+        except Exception as e:
+            return None, position, e
+        # Later kernels only need to look before the failure found so far
+        if index is not None:
+            failure, values = (index, position, None), values[:index]
+    return failure
+
+
+# Bounded: process pool workers are long-lived, and annotations may be built at runtime
+@functools.lru_cache(maxsize=1024)
+def _plan(element: Any) -> tuple[tuple[type, ...], tuple[tuple[Kernel, Any], ...]]:
+    keywords = sequence_checker(list, (element,)).keywords
+    return keywords["accepted_types"], keywords["kernels"]
+
+
+def process_sequence_failure(element: Any, values: Sequence) -> Optional[Failure]:
+    """`sequence_failure` for process workers, which rebuild the plan from `element`."""
+    return sequence_failure(values, *_plan(element))
+
+
+def check_sequence(
+    value,
+    origin_type,
+    args,
+    memo,
+    *,
+    element: Any,
+    element_type: type,
+    accepted_types: tuple[type, ...],
+    kernels: tuple[tuple[Kernel, Any], ...],
+    sample: Optional[Sample] = None,
+) -> bool:
+    if not isinstance(value, origin_type):
+        raise ConstraintViolation(value, origin_type)
+    values, positions = value, None
+    if (sample := active_sample(sample, memo)) is not None:
+        positions = sample.indices(len(value))
+        if isinstance(positions, range):
+            values = value[: len(positions)]
+        else:
+            values = [value[i] for i in positions]
+    settings = parallel.SETTINGS
+    if settings is not None and len(values) >= settings.min_size:
+        process_check = None
+        if settings.mode == "process" and parallel.picklable(element):
+            process_check = functools.partial(process_sequence_failure, element)
+        failure = parallel.first_failure(
+            values,
+            functools.partial(
+                sequence_failure, accepted_types=accepted_types, kernels=kernels
+            ),
+            settings,
+            process_check,
+        )
+    else:
+        failure = sequence_failure(values, accepted_types, kernels)
+    if failure is None:
+        return True
+    index, position, error = failure
+    if positions is not None and index is not None:
+        index = positions[index]
+    if position is None:
+        raise ConstraintViolation(value, element_type, index=index)
+    constraint = kernels[position][1]
+    if error is not None:
+        raise ConstraintViolation(value, origin_type, constraint, error)
+    raise ConstraintViolation(
+        value, origin_type, failed_constraint(constraint, value[index]), index=index
+    )
+
+
+def sequence_checker(
+    origin_type: Any, args: tuple, sample: Optional[Sample] = None
+) -> Optional[Callable]:
+    element = element_annotation(origin_type, args)
+    if type(element) is not AnnotatedAlias:
+        return None
+    element_type, element_args, extras = split_annotation(element)
+    if element_args or not isinstance(element_type, type):
+        return None
+    constraints = resolve_constraints(element_type, element_args, extras)
+    if not constraints:
+        return None
+    kernels = []
+    for checker, constraint in constraints:
+        if (kernel := element_kernel(checker, constraint, element_type)) is None:
+            return None
+        kernels.append((kernel, constraint))
+    return functools.partial(
+        check_sequence,
+        element=element,
+        element_type=element_type,
+        accepted_types=NUMERIC_TOWER.get(element_type, (element_type,)),
+        kernels=tuple(kernels),
+        sample=sample,
+    )
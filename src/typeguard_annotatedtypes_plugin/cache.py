@@ -0,0 +1,289 @@
+import functools
+import operator
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, NamedTuple, Optional
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    uncacheable: int
+    maxsize: Optional[int]
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+_MISSING = object()
+
+
+def same_spelling(stored: tuple, key: tuple) -> bool:
+    """Whether a cached `(origin_type, args, extras)` key, equal to `key`, also
+    spells its metadata the same way.
+
+    Gt(-2) == Gt(-2.0), but a failure should name the one declared. Keys made
+    of the same objects match outright; only equal keys made of distinct
+    objects pay for comparing reprs.
+    """
+    _, stored_args, stored_extras = stored
+    _, args, extras = key
+    if (stored_args is args or all(map(operator.is_, stored_args, args))) and all(
+        map(operator.is_, stored_extras, extras)
+    ):
+        return True
+    return repr((stored_args, stored_extras)) == repr((args, extras))
+
+
+def lookup_cache(maxsize: Optional[int] = 1024):
+    """Bounded LRU memoization for a typeguard checker lookup function.
+
+    Results (including `None`) are keyed on `(origin_type, args, extras)`; an
+    equal key spelled differently (see `same_spelling`) replaces the entry.
+    Keys that can't be hashed, e.g. `Predicate(Not(math.isfinite))`, bypass the
+    cache and are counted as `uncacheable`. Like `functools.lru_cache`, the
+    wrapper exposes `cache_info()` and `cache_clear()`; `maxsize=None` means unbounded.
+    """
+
+    def decorator(func: Callable[[Any, tuple, tuple], Any]):
+        cache: OrderedDict = OrderedDict()
+        lock = threading.RLock()
+        # hits, misses, evictions, uncacheable
+        stats = [0, 0, 0, 0]
+
+        @functools.wraps(func)
+        def wrapper(origin_type, args, extras):
+            key = (origin_type, args, extras)
+            try:
+                with lock:
+                    entry = cache.get(key, _MISSING)
+                    if entry is not _MISSING and same_spelling(entry[0], key):
+                        cache.move_to_end(key)
+                        stats[0] += 1
+                        return entry[1]
+            except TypeError:
+                with lock:
+                    stats[3] += 1
+                return func(origin_type, args, extras)
+
+            result = func(origin_type, args, extras)
+            with lock:
+                stats[1] += 1
+                cache[key] = (key, result)
+                cache.move_to_end(key)
+                while maxsize is not None and len(cache) > maxsize:
+                    cache.popitem(last=False)
+                    stats[2] += 1
+            return result
+
+        return _with_cache_api(wrapper, cache, lock, stats, maxsize)
+
+    return decorator
+
+
+class WeakCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    owners: int
+    currsize: int
+
+
+# Attribute of an owner object that holds the lookup results attached to it.
+WEAK_SLOT = "__typeguard_annotatedtypes_lookups__"
+
+
+class _LookupSlot(dict):
+    """Lookup results attached to their owner. Pickled and deep-copied owners
+    get an empty slot, since results may not be picklable."""
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        return _LookupSlot, ()
+
+    def __deepcopy__(self, memo):
+        return _LookupSlot()
+
+
+def weak_lookup_cache(
+    owner_of: Callable[[tuple], Optional[Any]], max_per_owner: int = 16
+):
+    """A cache tier, above `lookup_cache`, whose entries live as long as their annotation.
+
+    `owner_of(extras)` picks an object of the annotation, e.g. a constraint
+    instance, that can hold attributes. Results for that annotation are stored
+    on it instead of in the LRU, so nothing else keeps them, or the owner,
+    alive: they're freed with the owner by the garbage collector. Annotations
+    without an owner, or with unhashable keys, go through the LRU as before.
+    So do annotations whose owner already holds `max_per_owner` results: an
+    owner shared by many annotations (a module-level `Ge(0)` next to a
+    per-tenant `Le(limit)`) would otherwise keep all of them alive.
+    The wrapper adds `weak_cache_info()`; its `cache_clear()` clears both tiers.
+    """
+
+    def decorator(lookup: Callable[[Any, tuple, tuple], Any]):
+        compute = getattr(lookup, "__wrapped__", lookup)
+        # Only to clear and count live entries; dead owners drop out of the set
+        owners: weakref.WeakSet = weakref.WeakSet()
+        # hits, misses
+        stats = [0, 0]
+
+        @functools.wraps(lookup)
+        def wrapper(origin_type, args, extras):
+            owner = owner_of(extras)
+            if owner is None:
+                return lookup(origin_type, args, extras)
+            key = (origin_type, args, extras)
+            slot = owner.__dict__.get(WEAK_SLOT)
+            try:
+                entry = _MISSING if slot is None else slot.get(key, _MISSING)
+                if entry is not _MISSING and same_spelling(entry[0], key):
+                    stats[0] += 1
+                    return entry[1]
+            except TypeError:
+                return lookup(origin_type, args, extras)
+            if entry is _MISSING and slot is not None and len(slot) >= max_per_owner:
+                return lookup(origin_type, args, extras)
+            result = compute(origin_type, args, extras)
+            stats[1] += 1
+            if slot is None:
+                # Set through __dict__, which frozen dataclasses don't guard
+                slot = owner.__dict__.setdefault(WEAK_SLOT, _LookupSlot())
+                owners.add(owner)
+            slot[key] = (key, result)
+            return result
+
+        def weak_cache_info() -> WeakCacheInfo:
+            live = list(owners)
+            return WeakCacheInfo(
+                *stats, len(live), sum(len(o.__dict__[WEAK_SLOT]) for o in live)
+            )
+
+        def cache_clear() -> None:
+            lookup.cache_clear()
+            for owner in list(owners):
+                owner.__dict__[WEAK_SLOT].clear()
+            stats[:] = [0, 0]
+
+        wrapper.weak_cache_info = weak_cache_info  # type: ignore[attr-defined]
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+class InternTable:
+    """Canonicalizes equal keys to one shared value, built on first use.
+
+    Values are held weakly and carry their own key, so the table keeps neither
+    alive: an entry goes away once no cache or caller uses its value. Values
+    must take attributes and weak references, as functions and
+    `functools.partial` objects do. Unhashable keys aren't interned.
+    """
+
+    def __init__(self):
+        # hash(key) -> weak references to the values with keys of that hash
+        self._buckets: dict[int, list[weakref.ref]] = {}
+        # Reentrant: a value can die, and `_discard` run, during `build()`
+        self._lock = threading.RLock()
+
+    def intern(self, key: Any, build: Callable[[], Any]) -> Any:
+        """The shared value for `key`; `build()` makes it if there's none.
+
+        A `build()` result of None is returned without being interned.
+        """
+        try:
+            key_hash = hash(key)
+        except TypeError:
+            return build()
+        with self._lock:
+            for ref in list(self._buckets.get(key_hash, ())):
+                value = ref()
+                if value is not None and value.__interned_key__ == key:
+                    return value
+            # Buckets are only made for values, so None results leave nothing behind
+            if (value := build()) is not None:
+                value.__interned_key__ = key
+                self._buckets.setdefault(key_hash, []).append(
+                    weakref.ref(value, functools.partial(self._discard, key_hash))
+                )
+        return value
+
+    def _discard(self, key_hash: int, ref: weakref.ref) -> None:
+        with self._lock:
+            bucket = self._buckets.get(key_hash, [])
+            if ref in bucket:
+                bucket.remove(ref)
+            if not bucket:
+                self._buckets.pop(key_hash, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(
+                ref() is not None for bucket in self._buckets.values() for ref in bucket
+            )
+
+
+def pure_predicate(func: Optional[Callable] = None, *, maxsize: Optional[int] = 1024):
+    """Marks a `Predicate` function as pure, memoizing its results per value.
+
+    Use as `Predicate(pure_predicate(func))`, or as a decorator with or without
+    `maxsize`. Results are kept in a bounded LRU keyed on the value and its
+    type (so `1`, `1.0` and `True` are cached apart); unhashable values are
+    passed through and counted as `uncacheable`. The wrapper exposes
+    `cache_info()`, including `hit_rate`, and `cache_clear()`.
+    """
+
+    def decorator(func: Callable[[Any], Any]):
+        cache: OrderedDict = OrderedDict()
+        lock = threading.RLock()
+        # hits, misses, evictions, uncacheable
+        stats = [0, 0, 0, 0]
+
+        @functools.wraps(func)
+        def wrapper(value):
+            key = (type(value), value)
+            try:
+                with lock:
+                    result = cache.get(key, _MISSING)
+                    if result is not _MISSING:
+                        cache.move_to_end(key)
+                        stats[0] += 1
+                        return result
+            except TypeError:
+                with lock:
+                    stats[3] += 1
+                return func(value)
+
+            result = func(value)
+            with lock:
+                stats[1] += 1
+                cache[key] = result
+                while maxsize is not None and len(cache) > maxsize:
+                    cache.popitem(last=False)
+                    stats[2] += 1
+            return result
+
+        return _with_cache_api(wrapper, cache, lock, stats, maxsize)
+
+    return decorator if func is None else decorator(func)
+
+
+def _with_cache_api(wrapper, cache: OrderedDict, lock, stats: list, maxsize):
+    def cache_info() -> CacheInfo:
+        with lock:
+            return CacheInfo(*stats, maxsize, len(cache))
+
+    def cache_clear() -> None:
+        with lock:
+            cache.clear()
+            stats[:] = [0, 0, 0, 0]
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    return wrapper
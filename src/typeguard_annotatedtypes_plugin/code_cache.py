@@ -0,0 +1,117 @@
+"""Caches of the code objects behind generated validators.
+
+Compiling generated source is most of the cost of building a validator (see
+`compiler.py` and `signature.py`). The source depends only on the shape of a
+constraint plan, so within a process each shape is compiled once and the code
+object shared by every validator of that shape. With a cache directory set,
+through `use_disk_cache` or the `TYPEGUARD_ANNOTATEDTYPES_CACHE_DIR`
+environment variable, compiled code is also marshalled to disk, like
+`__pycache__`, and loaded by later processes instead of being compiled again.
+
+Entries are keyed by the SHA-256 of the generated source. Constraint values,
+predicates and origin types are bound when the code is called, not baked into
+it, so any constraint set can use the cache, including lambda `Predicate`s.
+Entries live under a directory named after the Python bytecode magic number
+and the `annotated-types` and plugin versions, so upgrading any of them starts
+a fresh cache. Unreadable entries are recompiled and rewritten.
+"""
+
+import contextlib
+import hashlib
+import importlib.metadata
+import importlib.util
+import marshal
+import os
+import tempfile
+import threading
+from pathlib import Path
+from types import CodeType
+from typing import Optional, Union
+
+CACHE_FORMAT = 1
+
+
+def _version(distribution: str) -> str:
+    try:
+        return importlib.metadata.version(distribution)
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+VERSION_TAG = "-".join(
+    (
+        f"v{CACHE_FORMAT}",
+        importlib.util.MAGIC_NUMBER.hex(),
+        f"at{_version('annotated-types')}",
+        f"plugin{_version('typeguard-annotatedtypes-plugin')}",
+    )
+)
+
+CACHE_DIR: Optional[Path] = None
+
+# (digest, filename) -> code object, for the most recently compiled shapes
+COMPILED_MAXSIZE = 1024
+_COMPILED: dict[tuple[str, str], CodeType] = {}
+_COMPILED_LOCK = threading.Lock()
+
+
+def use_disk_cache(directory: Union[str, os.PathLike, None]) -> None:
+    """Sets the cache directory; None disables the on-disk cache."""
+    global CACHE_DIR
+    CACHE_DIR = None if directory is None else Path(directory) / VERSION_TAG
+
+
+def source_digest(source: str) -> str:
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def cache_clear() -> None:
+    """Forgets the code compiled in this process; the on-disk cache is kept."""
+    with _COMPILED_LOCK:
+        _COMPILED.clear()
+
+
+def compile_cached(source: str, filename: str, digest: str) -> CodeType:
+    """`compile(source, filename, "exec")`, once per process for each source, and
+    through the on-disk cache if one is set."""
+    key = (digest, filename)
+    if (code := _COMPILED.get(key)) is not None:
+        return code
+    code = _load_or_compile(source, filename, digest)
+    with _COMPILED_LOCK:
+        if len(_COMPILED) >= COMPILED_MAXSIZE:
+            # Dicts keep insertion order: drop the oldest shape
+            del _COMPILED[next(iter(_COMPILED))]
+        _COMPILED[key] = code
+    return code
+
+
+def _load_or_compile(source: str, filename: str, digest: str) -> CodeType:
+    if CACHE_DIR is None:
+        return compile(source, filename, "exec")
+    path = CACHE_DIR / f"{digest}.marshal"
+    try:
+        code = marshal.loads(path.read_bytes())
+        if isinstance(code, CodeType) and code.co_filename == filename:
+            return code
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    code = compile(source, filename, "exec")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Written to a temporary file and renamed, so readers never see a partial entry
+        fd, temporary = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    except OSError:
+        return code
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(marshal.dumps(code))
+        os.replace(temporary, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(temporary)
+    return code
+
+
+if directory := os.environ.get("TYPEGUARD_ANNOTATEDTYPES_CACHE_DIR"):
+    use_disk_cache(directory)
@@ -0,0 +1,122 @@
+"""Compiles a constraint set into a single generated validator function.
+
+The generated function evaluates every constraint as one boolean expression,
+with bound values and predicate functions bound as closure constants. When the
+expression is falsy or raises, it falls back to `check_constraints`, which
+re-checks the value constraint by constraint and raises the usual `TypeCheckError`.
+"""
+
+import functools
+import linecache
+from typing import Any, Callable
+
+from . import (
+    check_bounds,
+    check_constraints,
+    check_ge,
+    check_gt,
+    check_le,
+    check_lt,
+    check_max_len,
+    check_min_len,
+    check_multiple_of,
+    check_predicate,
+)
+from .bounds import Bounds
+from .code_cache import compile_cached, source_digest
+
+# Unwrapped checker -> (constraint attribute, expression template).
+EXPRESSIONS: dict[Callable, tuple[str, str]] = {
+    check_gt.__wrapped__: ("gt", "value > {}"),
+    check_ge.__wrapped__: ("ge", "value >= {}"),
+    check_lt.__wrapped__: ("lt", "value < {}"),
+    check_le.__wrapped__: ("le", "value <= {}"),
+    check_multiple_of.__wrapped__: ("multiple_of", "value % {} == 0"),
+    check_min_len.__wrapped__: ("min_length", "len(value) >= {}"),
+    check_max_len.__wrapped__: ("max_length", "len(value) <= {}"),
+    check_predicate.__wrapped__: ("func", "{}(value)"),
+}
+
+
+def bounds_expression(bounds: Bounds, lower: str, upper: str) -> str:
+    """A chained comparison such as `_lo0 <= value < _hi0`."""
+    if not bounds.satisfiable:
+        return "False"
+    expression = "value"
+    if bounds.lower_constraint is not None:
+        expression = f"{lower} {'<=' if bounds.lower_inclusive else '<'} {expression}"
+    if bounds.upper_constraint is not None:
+        expression = f"{expression} {'<=' if bounds.upper_inclusive else '<'} {upper}"
+    return expression
+
+
+def generate_source(
+    origin_type: Any, constraints: tuple[tuple[Callable, Any], ...]
+) -> tuple[str, dict[str, Any]]:
+    """Returns the factory source and the closure constants to call it with."""
+    closure: dict[str, Any] = {
+        "_origin": origin_type,
+        "_constraints": constraints,
+        "_fallback": check_constraints,
+    }
+    terms = ["(type(value) is _origin or isinstance(value, _origin))"]
+    for i, (checker, constraint) in enumerate(constraints):
+        if checker is check_bounds.__wrapped__:
+            closure[f"_lo{i}"] = constraint.lower
+            closure[f"_hi{i}"] = constraint.upper
+            terms.append(bounds_expression(constraint, f"_lo{i}", f"_hi{i}"))
+        elif checker in EXPRESSIONS:
+            attribute, template = EXPRESSIONS[checker]
+            closure[f"_b{i}"] = getattr(constraint, attribute)
+            terms.append(template.format(f"_b{i}"))
+        else:
+            closure[f"_k{i}"] = checker
+            closure[f"_c{i}"] = constraint
+            terms.append(f"_k{i}(value, origin_type, args, memo, _c{i})")
+    condition = "\n                and ".join(terms)
+    source = f"""\
+def _factory({", ".join(closure)}):
+    def _v(value, origin_type=_origin, args=(), memo=None):
+        try:
+            if (
+                {condition}
+            ):
+                return True
+        except Exception:
+            pass
+        return _fallback(value, origin_type, args, memo, constraints=_constraints)
+
+    return _v
+"""
+    return source, closure
+
+
+def _build(origin_type: Any, constraints: tuple[tuple[Callable, Any], ...]):
+    source, closure = generate_source(origin_type, constraints)
+    digest = source_digest(source)
+    filename = f"<annotated-types validator {digest[:12]}>"
+    namespace: dict[str, Any] = {}
+    exec(compile_cached(source, filename, digest), namespace)
+    # Lets tracebacks and inspect show the generated source.
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    validator = namespace["_factory"](**closure)
+    validator.__source__ = source
+    return validator
+
+
+_cached_build = functools.lru_cache(maxsize=1024)(_build)
+
+
+def compile_constraints(
+    origin_type: Any, constraints: tuple[tuple[Callable, Any], ...]
+) -> Callable[..., bool]:
+    """Returns a checker equivalent to `partial(check_constraints, constraints=...)`.
+
+    Results are cached on `(origin_type, constraints)`; unhashable constraint
+    sets are compiled every time.
+    """
+    try:
+        hash(constraints)
+    except TypeError:
+        return _build(origin_type, constraints)
+    return _cached_build(origin_type, constraints)
@@ -0,0 +1,85 @@
+import reprlib
+from typing import Any, Optional
+
+from typeguard import TypeCheckError
+
+# Bounds the value reprs in error messages; see `set_repr_limits`.
+REPR = reprlib.Repr()
+REPR.maxstring = 200
+REPR.maxother = 200
+REPR.maxlong = 200
+REPR.maxlist = REPR.maxtuple = REPR.maxset = REPR.maxfrozenset = 20
+REPR.maxdeque = REPR.maxarray = REPR.maxdict = 20
+
+
+def set_repr_limits(**limits: int) -> None:
+    """Sets `reprlib.Repr` limits (`maxstring`, `maxlist`, ...) for error messages."""
+    for name, limit in limits.items():
+        if not hasattr(REPR, name):
+            raise TypeError(f"Unknown repr limit: {name!r}")
+        setattr(REPR, name, limit)
+
+
+class _LazyMessage:
+    __slots__ = ("error", "rendered")
+
+    def __init__(self, error: "ConstraintViolation"):
+        self.error = error
+        self.rendered: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self.rendered is None:
+            self.rendered = self.error.render()
+        return self.rendered
+
+    __repr__ = __str__
+
+
+class ConstraintViolation(TypeCheckError):
+    """A `TypeCheckError` that keeps the value, constraint and origin type it's about.
+
+    The message is rendered on first use, with the value's repr bounded by
+    the limits set with `set_repr_limits`.
+    `constraint` is None when the value isn't an instance of `origin_type`;
+    `error` is set when checking the constraint raised. `index` is set when
+    an element of a container `value` failed the constraint (or, with no
+    constraint, isn't an instance of `origin_type`).
+    """
+
+    def __init__(
+        self,
+        value: Any,
+        origin_type: Any,
+        constraint: Any = None,
+        error: Optional[BaseException] = None,
+        index: Any = None,
+    ):
+        super().__init__(_LazyMessage(self))  # type: ignore[arg-type]
+        self.value = value
+        self.origin_type = origin_type
+        self.constraint = constraint
+        self.error = error
+        self.index = index
+
+    def __reduce__(self):
+        # args holds the lazy message, not the constructor arguments; the
+        # state carries the path elements typeguard appended
+        arguments = (self.value, self.origin_type, self.constraint, self.error)
+        return type(self), (*arguments, self.index), vars(self).copy()
+
+    def render(self) -> str:
+        if self.index is not None:
+            element = REPR.repr(self.value[self.index])
+            if self.constraint is None:
+                name = getattr(self.origin_type, "__name__", self.origin_type)
+                return (
+                    f"with value[{self.index!r}]={element} is not an instance of {name}"
+                )
+            return f"with value[{self.index!r}]={element} failed {self.constraint}"
+        value = REPR.repr(self.value)
+        if self.constraint is None:
+            name = getattr(self.origin_type, "__name__", self.origin_type)
+            return f"{value} is not an instance of {name}"
+        if self.error is not None:
+            return f"with value={value} raised an error: {REPR.repr(self.error)}"
+        return f"with value={value} failed {self.constraint}"
@@ -0,0 +1,52 @@
+"""Shared plumbing for the container backends (`numpy_backend`, `buffer_backend`).
+
+A kernel checks one constraint against a whole container value. It returns
+None when the value passes, `WHOLE_VALUE` when the container as a whole
+fails (e.g. its length), or the index of the first failing element.
+"""
+
+from typing import Any, Callable, Optional
+
+from . import failed_constraint
+from .errors import ConstraintViolation
+
+Kernel = Callable[[Any], Optional[Any]]
+
+WHOLE_VALUE = ()
+
+
+def check_kernels(
+    value,
+    origin_type,
+    args,
+    memo,
+    *,
+    kernels: tuple[tuple[Kernel, Any], ...],
+) -> bool:
+    if not isinstance(value, origin_type):
+        raise ConstraintViolation(value, origin_type)
+    for kernel, constraint in kernels:
+        try:
+            index = kernel(value)
+        except Exception as e:
+            raise ConstraintViolation(value, origin_type, constraint, e)
+        if index is None:
+            continue
+        if index == WHOLE_VALUE:
+            raise ConstraintViolation(value, origin_type, constraint)
+        raise ConstraintViolation(
+            value,
+            origin_type,
+            failed_constraint(constraint, value[index]),
+            index=index,
+        )
+    return True
+
+
+def whole_value_kernel(checker: Callable, constraint: Any) -> Kernel:
+    """Applies an unwrapped checker to the container itself, e.g. `MinLen`."""
+
+    def kernel(value) -> Optional[Any]:
+        return None if checker(value, None, (), None, constraint) else WHOLE_VALUE
+
+    return kernel
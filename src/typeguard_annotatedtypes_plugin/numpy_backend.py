@@ -0,0 +1,126 @@
+"""Vectorized checks for `Annotated[np.ndarray, ...]`.
+
+Only imported by the plugin once an annotation's origin type is an ndarray
+subclass, i.e. when numpy is already imported. Element-wise constraints
+(bounds, `MultipleOf`, `IsFinite`/`IsNan`/`IsInfinite` and their negations)
+are applied as whole-array reductions; `MinLen`/`MaxLen` apply to `len(value)`.
+"""
+
+import functools
+import math
+from typing import Any, Callable, Optional
+
+import annotated_types as at
+import numpy as np
+
+from . import (
+    check_bounds,
+    check_max_len,
+    check_min_len,
+    check_multiple_of,
+    check_predicate,
+)
+from .bounds import Bounds
+from .kernels import WHOLE_VALUE, Kernel, check_kernels, whole_value_kernel
+
+FLOAT_CLASS_UFUNCS: dict[Callable, np.ufunc] = {
+    math.isfinite: np.isfinite,
+    math.isnan: np.isnan,
+    math.isinf: np.isinf,
+}
+
+
+def first_false(mask: np.ndarray) -> Optional[Any]:
+    """Index of the first False in `mask`; an int for 1-d masks, else a tuple."""
+    if mask.all():
+        return None
+    flat_index = int(np.argmin(mask, axis=None))
+    if mask.ndim == 1:
+        return flat_index
+    return tuple(int(i) for i in np.unravel_index(flat_index, mask.shape))
+
+
+def bounds_mask(value: np.ndarray, bounds: Bounds) -> np.ndarray:
+    mask = np.ones(value.shape, dtype=bool)
+    if bounds.lower_constraint is not None:
+        compare = np.greater_equal if bounds.lower_inclusive else np.greater
+        mask &= compare(value, bounds.lower)
+    if bounds.upper_constraint is not None:
+        compare = np.less_equal if bounds.upper_inclusive else np.less
+        mask &= compare(value, bounds.upper)
+    return mask
+
+
+def bounds_kernel(bounds: Bounds) -> Kernel:
+    def kernel(value: np.ndarray) -> Optional[Any]:
+        if value.size == 0:
+            return None
+        # min()/max() don't allocate; the mask is only built to locate a failure.
+        # NaN propagates through both, so it always fails.
+        if bounds.satisfiable:
+            ok = True
+            if bounds.lower_constraint is not None:
+                lowest = value.min()
+                ok = (
+                    lowest >= bounds.lower
+                    if bounds.lower_inclusive
+                    else lowest > bounds.lower
+                )
+            if ok and bounds.upper_constraint is not None:
+                highest = value.max()
+                ok = (
+                    highest <= bounds.upper
+                    if bounds.upper_inclusive
+                    else highest < bounds.upper
+                )
+            if ok:
+                return None
+        return first_false(bounds_mask(value, bounds))
+
+    return kernel
+
+
+def multiple_of_kernel(constraint: at.MultipleOf) -> Kernel:
+    return lambda value: first_false(np.mod(value, constraint.multiple_of) == 0)
+
+
+def ufunc_kernel(ufunc: np.ufunc, negate: bool) -> Kernel:
+    if negate:
+        return lambda value: first_false(~ufunc(value))
+    return lambda value: first_false(ufunc(value))
+
+
+def generic_kernel(checker: Callable, constraint: Any) -> Kernel:
+    """Calls the checker with the whole array; an array result is treated as a mask."""
+
+    def kernel(value: np.ndarray) -> Optional[Any]:
+        result = np.asarray(checker(value, None, (), None, constraint))
+        if result.shape == value.shape and result.ndim:
+            return first_false(result.astype(bool, copy=False))
+        return None if result.all() else WHOLE_VALUE
+
+    return kernel
+
+
+def make_kernel(checker: Callable, constraint: Any) -> Kernel:
+    if checker is check_bounds.__wrapped__:
+        return bounds_kernel(constraint)
+    if checker is check_multiple_of.__wrapped__:
+        return multiple_of_kernel(constraint)
+    if checker in (check_min_len.__wrapped__, check_max_len.__wrapped__):
+        return whole_value_kernel(checker, constraint)
+    if checker is check_predicate.__wrapped__:
+        func, negate = constraint.func, False
+        if isinstance(func, at.Not):
+            func, negate = func.func, True
+        if func in FLOAT_CLASS_UFUNCS:
+            return ufunc_kernel(FLOAT_CLASS_UFUNCS[func], negate)
+    return generic_kernel(checker, constraint)
+
+
+def ndarray_checker(constraints: tuple[tuple[Callable, Any], ...]):
+    kernels = tuple(
+        (make_kernel(checker, constraint), constraint)
+        for checker, constraint in constraints
+    )
+    return functools.partial(check_kernels, kernels=kernels)
@@ -0,0 +1,127 @@
+"""Opt-in parallel validation of very large sequences on the bulk path (see `bulk.py`).
+
+Off by default; enable it with `use_parallel_validation`. Sequences of at
+least `min_size` elements are split into chunks that are checked on a thread
+or process pool. Chunk sizes come from the measured cost of checking a first
+probe chunk in the calling thread. Whatever the scheduling, the failure
+reported is the lowest failing index.
+
+The kernels mostly run C code that holds the GIL, so thread mode pays off on
+free-threaded CPython builds; process mode suits expensive predicates, at
+the cost of pickling every chunk.
+"""
+
+import math
+import os
+import pickle
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Literal, Optional, Sequence
+
+# (index, kernel position, error); see `bulk.sequence_failure`.
+Failure = tuple[Any, Optional[int], Optional[BaseException]]
+ChunkCheck = Callable[[Sequence], Optional[Failure]]
+
+PROBE_SIZE = 4096
+
+# Chunks are sized to take roughly this long to check, so each one is worth
+# its scheduling (and for processes, pickling) overhead.
+TARGET_CHUNK_SECONDS = {"thread": 0.002, "process": 0.02}
+
+
+@dataclass
+class ParallelSettings:
+    mode: Literal["thread", "process"]
+    max_workers: int
+    min_size: int
+    executors: dict[str, Executor] = field(default_factory=dict, repr=False)
+
+    def get_executor(self, mode: str) -> Executor:
+        if mode not in self.executors:
+            pool = ThreadPoolExecutor if mode == "thread" else ProcessPoolExecutor
+            self.executors[mode] = pool(self.max_workers)
+        return self.executors[mode]
+
+    def shutdown(self) -> None:
+        for executor in self.executors.values():
+            executor.shutdown(wait=False)
+
+
+SETTINGS: Optional[ParallelSettings] = None
+
+
+def use_parallel_validation(
+    mode: Optional[Literal["thread", "process"]] = "thread",
+    *,
+    max_workers: Optional[int] = None,
+    min_size: int = 100_000,
+) -> None:
+    """Enables parallel checking of sequences of at least `min_size` elements.
+
+    `mode=None` turns it off again.
+    """
+    global SETTINGS
+    if mode not in (None, "thread", "process"):
+        raise ValueError(f"Unknown mode: {mode!r}")
+    if SETTINGS is not None:
+        SETTINGS.shutdown()
+    if mode is None:
+        SETTINGS = None
+        return
+    SETTINGS = ParallelSettings(mode, max_workers or os.cpu_count() or 1, min_size)
+
+
+def picklable(obj: Any) -> bool:
+    try:
+        pickle.dumps(obj)
+    except Exception:
+        return False
+    return True
+
+
+def chunk_size_for(
+    per_element: float, remaining: int, settings: ParallelSettings
+) -> int:
+    target = TARGET_CHUNK_SECONDS[settings.mode]
+    size = int(target / per_element) if per_element else remaining
+    # Never fewer chunks than workers
+    return max(PROBE_SIZE, min(size, math.ceil(remaining / settings.max_workers)))
+
+
+def first_failure(
+    values: Sequence,
+    check_chunk: ChunkCheck,
+    settings: ParallelSettings,
+    process_check_chunk: Optional[ChunkCheck] = None,
+) -> Optional[Failure]:
+    """The lowest-index failure among `values`, checked in parallel chunks.
+
+    In process mode, `process_check_chunk` is the picklable equivalent of
+    `check_chunk`; without one, chunks are checked on threads instead.
+    """
+    started = time.perf_counter()
+    if (failure := check_chunk(values[:PROBE_SIZE])) is not None:
+        return failure
+    per_element = (time.perf_counter() - started) / PROBE_SIZE
+    remaining = len(values) - PROBE_SIZE
+    if remaining <= 0:
+        return None
+    if settings.mode == "process" and process_check_chunk is not None:
+        executor, task = settings.get_executor("process"), process_check_chunk
+    else:
+        executor, task = settings.get_executor("thread"), check_chunk
+    size = chunk_size_for(per_element, remaining, settings)
+    starts = range(PROBE_SIZE, len(values), size)
+    futures = [executor.submit(task, values[start : start + size]) for start in starts]
+    try:
+        # In index order, so the first failing chunk holds the lowest index
+        for start, future in zip(starts, futures):
+            failure = future.result()
+            if failure is not None:
+                index, position, error = failure
+                return (None if index is None else start + index), position, error
+    finally:
+        for future in futures:
+            future.cancel()
+    return None
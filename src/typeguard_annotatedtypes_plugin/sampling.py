@@ -0,0 +1,91 @@
+"""Sampled element checks for large collections on the bulk path (see `bulk.py`).
+
+A `Sample` picks which elements of a collection have their constraints
+checked: the first N, k at random, or a fraction at random. It applies per
+annotation, as `Annotated[List[X], Sample(...)]`, or globally through
+`use_sampling`. Without either, typeguard's collection check strategy decides,
+as it does for other collections: `FIRST_ITEM` (the default) checks the first
+element only. Calls whose configuration asks for
+`CollectionCheckStrategy.ALL_ITEMS` always check every element.
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+from typeguard import CollectionCheckStrategy, TypeCheckMemo
+
+
+@dataclass(frozen=True)
+class Sample:
+    """Check only `first` elements, `k` random elements or a random `fraction` of them.
+
+    Random samples are drawn with `seed`, so the same positions are checked on
+    every call; with `seed=None`, each call draws a new sample.
+    """
+
+    first: Optional[int] = None
+    k: Optional[int] = None
+    fraction: Optional[float] = None
+    seed: Optional[int] = 0
+
+    def __post_init__(self):
+        given = [
+            name
+            for name in ("first", "k", "fraction")
+            if getattr(self, name) is not None
+        ]
+        if len(given) != 1:
+            raise ValueError("Sample takes exactly one of first, k or fraction")
+        if self.fraction is not None and not 0 < self.fraction <= 1:
+            raise ValueError(f"fraction must be in (0, 1], got {self.fraction}")
+        if any(count is not None and count < 1 for count in (self.first, self.k)):
+            raise ValueError("first and k must be positive")
+
+    def indices(self, size: int) -> Sequence[int]:
+        """The sorted positions to check in a collection of `size` elements."""
+        if self.first is not None:
+            return range(min(self.first, size))
+        if self.k is not None:
+            count = min(self.k, size)
+        else:
+            count = math.ceil(self.fraction * size)
+        if count == size:
+            return range(size)
+        return sorted(random.Random(self.seed).sample(range(size), count))
+
+
+SAMPLING: Optional[Sample] = None
+
+# typeguard's default `CollectionCheckStrategy.FIRST_ITEM`, as a sample
+FIRST_ITEM = Sample(first=1)
+
+
+def use_sampling(sample: Optional[Sample]) -> None:
+    """Sets the `Sample` used by annotations without their own; None checks everything."""
+    global SAMPLING
+    SAMPLING = sample
+
+
+def active_sample(
+    sample: Optional[Sample], memo: Optional[TypeCheckMemo]
+) -> Optional[Sample]:
+    """The sample to check, or None to check every element."""
+    if memo is None:
+        return sample or SAMPLING
+    if memo.config.collection_check_strategy is CollectionCheckStrategy.ALL_ITEMS:
+        return None
+    return sample or SAMPLING or FIRST_ITEM
+
+
+def split_sample(extras: tuple) -> tuple[Optional[Sample], tuple]:
+    """The annotation's `Sample`, if any, and the rest of its metadata."""
+    sample = None
+    rest: list[Any] = []
+    for extra in extras:
+        if isinstance(extra, Sample):
+            sample = extra
+        else:
+            rest.append(extra)
+    return sample, tuple(rest)
@@ -0,0 +1,191 @@
+"""Validates a whole function signature with one generated wrapper.
+
+`compile_signature` resolves the plugin's checker for every parameter and the
+return annotation once, when the function is decorated, and generates a
+wrapper with the function's own signature that calls those checkers directly.
+A call then costs one wrapper call plus the checks themselves; there are no
+per-call typeguard lookups. Annotations the plugin has no checker for are not
+checked; stack `@typechecked` on top for those (it checks everything again).
+Functions whose annotations hold forward references that don't resolve at
+decoration time are compiled on their first call instead.
+"""
+
+import functools
+import inspect
+import linecache
+from inspect import Parameter
+from typing import Any, Callable, Optional, TypeVar, get_type_hints
+
+from typeguard import TypeCheckError, TypeCheckMemo
+
+from . import plugin_lookup, split_annotation
+from .code_cache import compile_cached, source_digest
+
+T_CallableOrType = TypeVar("T_CallableOrType", bound=Callable[..., Any])
+
+
+_STARRED = (Parameter.VAR_POSITIONAL, Parameter.KEYWORD_ONLY, Parameter.VAR_KEYWORD)
+
+
+def annotation_checker(annotation: Any) -> Optional[tuple[Callable, Any, tuple]]:
+    """`(checker, origin_type, args)` for an annotation, or None without a plugin checker."""
+    origin_type, args, extras = split_annotation(annotation)
+    checker = plugin_lookup(origin_type, args, extras)
+    return None if checker is None else (checker, origin_type, args)
+
+
+def fail(exc: TypeCheckError, path: str, memo: TypeCheckMemo) -> None:
+    exc.append_path_element(path)
+    if memo.config.typecheck_fail_callback:
+        memo.config.typecheck_fail_callback(exc, memo)
+    else:
+        raise exc
+
+
+def _check_lines(
+    closure: dict[str, Any], key: str, checker: tuple, value: str, path: str
+) -> list[str]:
+    """Lines checking the expression `value`; `path` is an f-string on failure."""
+    closure[f"_tg_k{key}"], closure[f"_tg_o{key}"], closure[f"_tg_a{key}"] = checker
+    return [
+        "try:",
+        f"    _tg_k{key}({value}, _tg_o{key}, _tg_a{key}, _tg_memo)",
+        "except _tg_TypeCheckError as _tg_exc:",
+        f"    _tg_fail(_tg_exc, {path}, _tg_memo)",
+    ]
+
+
+def generate_source(func: Callable) -> Optional[tuple[str, dict[str, Any]]]:
+    """The wrapper factory source and its closure constants; None if nothing is checked."""
+    hints = get_type_hints(func, include_extras=True)
+    closure: dict[str, Any] = {"_tg_func": func}
+    params: list[str] = []
+    call_args: list[str] = []
+    body: list[str] = []
+    previous = None
+    for i, param in enumerate(inspect.signature(func).parameters.values()):
+        name, kind = param.name, param.kind
+        if name.startswith("_tg_"):
+            raise ValueError(
+                f"{func.__qualname__}: parameter {name!r} would shadow a name "
+                "of the generated wrapper"
+            )
+        if previous is Parameter.POSITIONAL_ONLY and kind is not previous:
+            params.append("/")
+        if kind is Parameter.KEYWORD_ONLY and previous not in _STARRED:
+            params.append("*")
+        previous = kind
+        if kind is Parameter.VAR_POSITIONAL:
+            params.append(f"*{name}")
+            call_args.append(f"*{name}")
+        elif kind is Parameter.VAR_KEYWORD:
+            params.append(f"**{name}")
+            call_args.append(f"**{name}")
+        else:
+            if param.default is param.empty:
+                params.append(name)
+            else:
+                closure[f"_tg_d{i}"] = param.default
+                params.append(f"{name}=_tg_d{i}")
+            keyword = kind is Parameter.KEYWORD_ONLY
+            call_args.append(f"{name}={name}" if keyword else name)
+
+        if name not in hints or (checker := annotation_checker(hints[name])) is None:
+            continue
+        if kind in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD):
+            values = f"{name}.values()" if kind is Parameter.VAR_KEYWORD else name
+            path = f"f'argument \"{name}\" ({{_tg_type(_tg_v).__qualname__}})'"
+            body.append(f"for _tg_v in {values}:")
+            body.extend(
+                f"    {line}"
+                for line in _check_lines(closure, str(i), checker, "_tg_v", path)
+            )
+        else:
+            path = f"f'argument \"{name}\" ({{_tg_type({name}).__qualname__}})'"
+            body.extend(_check_lines(closure, str(i), checker, name, path))
+    if previous is Parameter.POSITIONAL_ONLY:
+        params.append("/")
+
+    is_async = inspect.iscoroutinefunction(func)
+    call = f"{'await ' if is_async else ''}_tg_func({', '.join(call_args)})"
+    # Calling a generator function only creates the generator; nothing to check
+    checker = None
+    if "return" in hints and not (
+        inspect.isgeneratorfunction(func) or inspect.isasyncgenfunction(func)
+    ):
+        checker = annotation_checker(hints["return"])
+    if checker is None:
+        if not body:
+            return None
+        body.append(f"return {call}")
+    else:
+        path = "f'the return value ({_tg_type(_tg_r).__qualname__})'"
+        body.append(f"_tg_r = {call}")
+        body.extend(_check_lines(closure, "r", checker, "_tg_r", path))
+        body.append("return _tg_r")
+
+    closure["_tg_memo"] = TypeCheckMemo(func.__globals__, {})
+    closure["_tg_fail"] = fail
+    # Bound like the checkers, so parameters named `type` etc. can't shadow them
+    closure["_tg_type"] = type
+    closure["_tg_TypeCheckError"] = TypeCheckError
+    lines = "\n".join(f"        {line}" for line in body)
+    source = f"""\
+def _factory({", ".join(closure)}):
+    {"async " if is_async else ""}def _tg_wrapper({", ".join(params)}):
+{lines}
+
+    return _tg_wrapper
+"""
+    return source, closure
+
+
+def compile_signature(func: T_CallableOrType) -> T_CallableOrType:
+    """Decorator that validates `func`'s `Annotated` parameters and return value
+    with checkers resolved once, at decoration time.
+
+    Returns `func` itself when none of its annotations has a plugin checker.
+    Annotations that can't be resolved yet, like a method's forward reference
+    to its own class, delay all of this to the first call.
+    """
+    try:
+        return _compile(func)
+    except NameError:
+        return _compile_on_first_call(func)
+
+
+def _compile_on_first_call(func: T_CallableOrType) -> T_CallableOrType:
+    compiled: Optional[Callable] = None
+
+    def compile_once() -> Callable:
+        nonlocal compiled
+        if compiled is None:
+            compiled = _compile(func)
+        return compiled
+
+    if inspect.iscoroutinefunction(func):
+
+        async def wrapper(*args, **kwargs):
+            return await compile_once()(*args, **kwargs)
+
+    else:
+
+        def wrapper(*args, **kwargs):
+            return compile_once()(*args, **kwargs)
+
+    return functools.update_wrapper(wrapper, func)  # type: ignore[return-value]
+
+
+def _compile(func: T_CallableOrType) -> T_CallableOrType:
+    if (generated := generate_source(func)) is None:
+        return func
+    source, closure = generated
+    digest = source_digest(source)
+    filename = f"<annotated-types signature {digest[:12]}>"
+    namespace: dict[str, Any] = {}
+    exec(compile_cached(source, filename, digest), namespace)
+    # Lets tracebacks and inspect show the generated source.
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    wrapper = namespace["_factory"](**closure)
+    wrapper.__source__ = source
+    return functools.update_wrapper(wrapper, func)  # type: ignore[return-value]
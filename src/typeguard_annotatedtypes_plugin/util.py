@@ -1,23 +1,121 @@
 # region util
 import functools
+import logging
+import os
+import sys
+from collections import deque
+from typing import Any, Callable, Optional
+
+TRACE_ENV_VAR = "TYPEGUARD_ANNOTATEDTYPES_TRACE"
 
 INDENT_COUNT = 0
 
+TraceSink = Callable[[str], Any]
+
+_TRACE_SINK: Optional[TraceSink] = None
+
+# (module namespace, name, undecorated function, tracing wrapper)
+_TRACED: list[tuple[dict, str, Callable, Callable]] = []
+
+
+def logging_sink(
+    logger: Optional[logging.Logger] = None, level: int = logging.DEBUG
+) -> TraceSink:
+    logger = logger or logging.getLogger(__package__)
+    return functools.partial(logger.log, level)
+
+
+def file_sink(path: str) -> TraceSink:
+    file = open(path, "a", encoding="utf-8")  # noqa: SIM115
+
+    def write(line: str) -> None:
+        file.write(line + "\n")
+        file.flush()
+
+    return write
+
+
+class RingBufferSink:
+    """Keeps the last `maxlen` trace lines in memory."""
+
+    def __init__(self, maxlen: int = 1000):
+        self.lines: deque[str] = deque(maxlen=maxlen)
+
+    def __call__(self, line: str) -> None:
+        self.lines.append(line)
+
+
+def enable_tracing(sink: Optional[TraceSink] = None) -> None:
+    """Installs the tracing wrappers of every `trace_input_output` function.
 
-def print_input_output(func):
+    Trace lines go to `sink`, or to the package logger at DEBUG level.
+    """
+    global _TRACE_SINK
+    _TRACE_SINK = sink or logging_sink()
+    for namespace, name, _func, wrapper in _TRACED:
+        namespace[name] = wrapper
+
+
+def disable_tracing() -> None:
+    """Reinstalls the undecorated functions."""
+    global _TRACE_SINK
+    _TRACE_SINK = None
+    for namespace, name, func, _wrapper in _TRACED:
+        namespace[name] = func
+
+
+def external_stacklevel() -> int:
+    """The `warnings.warn` stacklevel, for the function calling this one, that
+    points at the first frame outside this plugin, typeguard and the code the
+    plugin generates: where the user's annotation is being checked."""
+    frame, level = sys._getframe(1), 1
+    while frame.f_back is not None and (
+        frame.f_globals.get("__name__", "").partition(".")[0]
+        in ("typeguard", __package__)
+        or frame.f_code.co_filename.startswith("<annotated-types ")
+    ):
+        frame, level = frame.f_back, level + 1
+    return level
+
+
+def _sink_from_env() -> Optional[TraceSink]:
+    """`TYPEGUARD_ANNOTATEDTYPES_TRACE=1` traces to the logger; any other value
+    except `0` is taken as a file path to append to."""
+    value = os.environ.get(TRACE_ENV_VAR, "0")
+    if value in ("", "0"):
+        return None
+    if value == "1":
+        return logging_sink()
+    return file_sink(value)
+
+
+def _format_result(result) -> str:
+    if isinstance(result, functools.partial):
+        keywords = ", ".join(f"{k}={v!r}" for k, v in result.keywords.items())
+        return f"{result.func.__name__}(..., {keywords})"
+    return repr(result)
+
+
+def trace_input_output(func):
+    """Traces calls to `func` and their results while tracing is enabled.
+
+    The wrapper is swapped into `func`'s module namespace by `enable_tracing`;
+    while tracing is disabled the undecorated function is installed, so call
+    sites that look it up by name pay nothing.
+    """
     __tracebackhide__ = True
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         global INDENT_COUNT
+        sink = _TRACE_SINK
+        if sink is None:
+            return func(*args, **kwargs)
         args_str = [f"{arg!r}" for arg in args]
         kwargs_str = [f"{k}={v!r}" for k, v in kwargs.items()]
         all_args = ", ".join(args_str + kwargs_str)
 
-        indent = "  " * INDENT_COUNT
-        print(
-            f"{indent}\033[38;5;246m➡️  {func.__name__}({all_args})\033[0m"
-        )  # Gray color
+        sink(f"{'  ' * INDENT_COUNT}➡️  {func.__name__}({all_args})")
 
         INDENT_COUNT += 1
         try:
@@ -25,18 +123,12 @@ def print_input_output(func):
         finally:
             INDENT_COUNT -= 1
 
-        indent = "  " * INDENT_COUNT
-        color = "67" if result is None else "75"
-        if isinstance(result, functools.partial):
-            result_str = f"{result.func.__name__}(..., {', '.join(f'{k}={v!r}' for k, v in result.keywords.items())})"
-            print(
-                f"{indent}\033[38;5;{color}m⬅️  {func.__name__} ==> {result_str}\033[0m"
-            )
-        else:
-            print(f"{indent}\033[38;5;{color}m⬅️  {func.__name__} ==> {result!r}\033[0m")
+        sink(f"{'  ' * INDENT_COUNT}⬅️  {func.__name__} ==> {_format_result(result)}")
         return result
 
-    return wrapper
+    namespace = vars(sys.modules[func.__module__])
+    _TRACED.append((namespace, func.__name__, func, wrapper))
+    return func if _TRACE_SINK is None else wrapper
 
 
 def on_exception_return_none(func):
@@ -52,4 +144,6 @@ def on_exception_return_none(func):
     return wrapper
 
 
+_TRACE_SINK = _sink_from_env()
+
 # endregion
@@ -0,0 +1,163 @@
+import asyncio
+import itertools
+import math
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, AsyncIterator, Generator, Iterator, List
+
+import annotated_types as at
+import pytest
+from typeguard import TypeCheckError
+
+from typeguard_annotatedtypes_plugin import ConstraintViolation, Sample, use_sampling
+from typeguard_annotatedtypes_plugin.batch import (
+    validate_async_stream,
+    validate_columns,
+    validate_many,
+    validate_stream,
+)
+
+Percent = Annotated[int, at.Ge(0), at.Le(100)]
+
+
+def test_all_valid():
+    assert validate_many(range(101), Percent) == []
+    assert validate_many(range(101), Percent, mode="collect") == []
+
+
+def test_raise_mode_stops_at_first_failure():
+    with pytest.raises(
+        ConstraintViolation, match=re.escape("item 2 with value=-1 failed Ge(ge=0)")
+    ):
+        validate_many([1, 2, -1, 200], Percent)
+
+
+def test_collect_mode_returns_failure_indices():
+    assert validate_many([1, -1, 50, 101, "x"], Percent, mode="collect") == [1, 3, 4]
+
+
+def test_annotations_without_plugin_checker_fall_back_to_typeguard():
+    values = [[1], ["a"], [2, 3]]
+    assert validate_many(values, List[int], mode="collect") == [1]
+    with pytest.raises(TypeCheckError, match="item 1"):
+        validate_many(values, List[int])
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError, match="Unknown mode"):
+        validate_many([], Percent, mode="first")
+
+
+PRICE = Annotated[float, at.Gt(0)]
+QTY = Annotated[int, at.Ge(1), at.Le(1000)]
+BATCH = {
+    "price": [1.5, 0.0, 2.0, -1.0],
+    "qty": [1, 5, 5000, 10],
+    "note": ["ignored", "by", "the", "schema"],
+}
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_validate_columns(max_workers):
+    failures = validate_columns(
+        BATCH, {"price": PRICE, "qty": QTY}, max_workers=max_workers
+    )
+    assert failures == {"price": [1, 3], "qty": [2]}
+
+
+def test_validate_columns_requires_schema_columns():
+    with pytest.raises(KeyError, match="ts"):
+        validate_columns(BATCH, {"price": PRICE, "ts": int})
+
+
+@pytest.mark.parametrize(
+    "annotation",
+    [Percent, Iterator[Percent], Generator[Percent, None, None]],
+)
+def test_validate_stream(annotation):
+    stream = validate_stream(iter(range(101)), annotation, chunk_size=7)
+    assert list(stream) == list(range(101))
+
+
+def test_validate_stream_is_lazy():
+    stream = validate_stream(itertools.count(), Annotated[int, at.Ge(0)], chunk_size=3)
+    assert list(itertools.islice(stream, 10)) == list(range(10))
+
+
+@pytest.mark.parametrize(
+    "annotation", [Percent, at.IsFinite[float], Annotated[int, at.Lt(5)]]
+)
+def test_validate_stream_yields_up_to_failure(annotation):
+    values = [1, 2, 3, 4, 5, 6, 7, 8, 200, float("inf"), 9]
+    stream = validate_stream(values, annotation, chunk_size=4)
+    consumed = []
+    with pytest.raises(TypeCheckError) as exc_info:
+        for value in stream:
+            consumed.append(value)
+    index = len(consumed)
+    assert str(exc_info.value).startswith(f"item {index} ")
+    assert consumed == values[:index]
+
+
+def test_validate_stream_checks_every_element_without_plugin_checker():
+    stream = validate_stream([[1], [2], ["a"]], List[int])
+    with pytest.raises(TypeCheckError, match="item 2"):
+        list(stream)
+
+
+def test_validate_stream_chunk_size():
+    with pytest.raises(ValueError, match="chunk_size"):
+        validate_stream([], Percent, chunk_size=0)
+
+
+async def _produce(values):
+    for value in values:
+        yield value
+
+
+def _consume(stream):
+    consumed = []
+
+    async def consume():
+        async for value in stream:
+            consumed.append(value)
+
+    try:
+        asyncio.run(consume())
+    except TypeCheckError as exc:
+        return consumed, exc
+    return consumed, None
+
+
+Chunk = Annotated[bytes, at.MaxLen(4)]
+
+
+@pytest.mark.parametrize("annotation", [Chunk, AsyncIterator[Chunk]])
+@pytest.mark.parametrize("executor", [None, ThreadPoolExecutor(max_workers=1)])
+def test_validate_async_stream(annotation, executor):
+    values = [b"a", b"bb", b"ccc", b"dddd", b"e"]
+    stream = validate_async_stream(
+        _produce(values), annotation, executor=executor, chunk_size=2
+    )
+    assert _consume(stream) == (values, None)
+
+
+@pytest.mark.parametrize("executor", [None, ThreadPoolExecutor(max_workers=1)])
+def test_validate_async_stream_yields_up_to_failure(executor):
+    values = [b"a", b"bb", b"ccc", b"toolong", b"e"]
+    stream = validate_async_stream(
+        _produce(values), Chunk, executor=executor, chunk_size=2
+    )
+    consumed, exc = _consume(stream)
+    assert consumed == values[:3]
+    assert str(exc).startswith("item 3 ")
+
+
+def test_validate_stream_ignores_sampling():
+    use_sampling(Sample(first=1))
+    try:
+        stream = validate_stream(iter([1.0, math.inf]), Iterator[at.IsFinite[float]])
+        with pytest.raises(TypeCheckError, match="item 1"):
+            list(stream)
+    finally:
+        use_sampling(None)
@@ -0,0 +1,68 @@
+import math
+from array import array
+from typing import Annotated
+
+import annotated_types as at
+import pytest
+from typeguard import check_type
+
+from typeguard_annotatedtypes_plugin import ConstraintViolation
+
+Percent = Annotated[array, at.Ge(0), at.Le(100)]
+Bytes7Bit = Annotated[memoryview, at.Interval(ge=0, lt=128)]
+
+
+@pytest.mark.parametrize("typecode", "bhilqfd")
+def test_array_bounds(typecode):
+    check_type(array(typecode, [0, 50, 100]), Percent)
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_type(array(typecode, [0, 101, -1]), Percent)
+    assert exc_info.value.index == 1
+    assert str(exc_info.value).endswith("failed Le(le=100)")
+
+
+def test_nan_fails_bounds():
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_type(array("d", [1.0, math.nan, 2.0]), Percent)
+    assert exc_info.value.index == 1
+
+
+def test_memoryview_over_bytes():
+    check_type(memoryview(b"hello"), Bytes7Bit)
+    with pytest.raises(ConstraintViolation, match=r"value\[2\]=200 failed Lt"):
+        check_type(memoryview(bytes([1, 2, 200])), Bytes7Bit)
+
+
+def test_bounds_implied_by_the_format_skip_the_scan():
+    # Every "B" element satisfies Ge(0) and Le(255), so no scan is needed.
+    check_type(
+        memoryview(bytes(range(256))), Annotated[memoryview, at.Ge(0), at.Le(255)]
+    )
+
+
+def test_multidimensional_memoryview():
+    view = memoryview(array("i", [1, 2, 3, -4, 5, 6])).cast("B").cast("i", (2, 3))
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_type(view, Annotated[memoryview, at.Ge(0)])
+    assert exc_info.value.index == (1, 0)
+
+
+def test_multiple_of():
+    annotation = Annotated[array, at.MultipleOf(4)]
+    check_type(array("q", [0, 4, 8]), annotation)
+    check_type(array("d", [0.0, 4.0]), annotation)
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_type(array("q", [0, 4, 6]), annotation)
+    assert exc_info.value.index == 2
+
+
+def test_len_applies_to_the_buffer():
+    annotation = Annotated[memoryview, at.MaxLen(3)]
+    check_type(memoryview(b"abc"), annotation)
+    with pytest.raises(ConstraintViolation, match="failed MaxLen"):
+        check_type(memoryview(b"abcd"), annotation)
+
+
+def test_unsupported_format():
+    with pytest.raises(ConstraintViolation, match="unsupported buffer format"):
+        check_type(array("u", "abc"), Annotated[array, at.Ge("a")])
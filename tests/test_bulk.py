@@ -0,0 +1,124 @@
+import math
+import sys
+from typing import Annotated, List, Tuple
+
+import annotated_types as at
+import pytest
+from typeguard import CollectionCheckStrategy, TypeCheckError, check_type
+
+from typeguard_annotatedtypes_plugin import ConstraintViolation, annotated_type_lookup
+
+
+def check_all_items(value, annotation):
+    return check_type(
+        value, annotation, collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS
+    )
+
+
+@pytest.mark.parametrize(
+    "marker, valid, invalid, index",
+    [
+        (at.IsFinite, [1.0, 2, -3.5], [1.0, math.inf, math.nan], 1),
+        (at.IsNotFinite, [math.nan, math.inf], [math.inf, 1.0], 1),
+        (at.IsNan, [math.nan], [math.nan, math.nan, 1.0], 2),
+        (at.IsNotNan, [1.0, math.inf], [math.nan], 0),
+        (at.IsInfinite, [math.inf, -math.inf], [math.inf, math.nan], 1),
+        (at.IsNotInfinite, [math.nan, 1.23], [1.0, -math.inf], 1),
+    ],
+)
+def test_float_class_lists(marker, valid, invalid, index):
+    annotation = List[marker[float]]
+    check_all_items(valid, annotation)
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_all_items(invalid, annotation)
+    assert exc_info.value.index == index
+
+
+def test_variadic_tuples():
+    annotation = Tuple[at.IsFinite[float], ...]
+    check_all_items((1.0, 2.0), annotation)
+    with pytest.raises(ConstraintViolation, match=r"value\[2\]=inf failed"):
+        check_all_items((1.0, 2.0, math.inf), annotation)
+
+
+def test_every_element_type_is_checked():
+    with pytest.raises(
+        ConstraintViolation, match=r"value\[3\]='x' is not an instance of float"
+    ):
+        check_all_items([1.0, 2.0, 3.0, "x"], List[at.IsFinite[float]])
+    with pytest.raises(ConstraintViolation, match="is not an instance of list"):
+        check_all_items((1.0,), List[at.IsFinite[float]])
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_large_sequences(monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setitem(sys.modules, "numpy", None)
+    values = [float(i) for i in range(10_000)]
+    check_all_items(values, List[at.IsFinite[float]])
+    values[9_000] = math.nan
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_all_items(values, List[at.IsFinite[float]])
+    assert exc_info.value.index == 9_000
+
+
+def test_unsupported_element_constraints_are_left_to_typeguard():
+    odd = at.Predicate(lambda value: value % 2)
+    assert annotated_type_lookup(list, (Annotated[int, odd],), ()) is None
+    with pytest.raises(TypeCheckError):
+        check_all_items([2], List[Annotated[int, odd]])
+
+
+@pytest.mark.parametrize(
+    "element, invalid, index, constraint",
+    [
+        (Annotated[int, at.Ge(0), at.Lt(10)], [0, 9, 10, -1], 2, at.Lt(10)),
+        (Annotated[int, at.Ge(0), at.Lt(10)], [0, -1, 10], 1, at.Ge(0)),
+        (Annotated[float, at.Gt(0)], [1, 2.5, math.nan, 3.0], 2, at.Gt(0)),
+        (Annotated[int, at.MultipleOf(3)], [3, 0, 9, 4], 3, at.MultipleOf(3)),
+        # Partially ordered: min() and max() pass, frozenset({3}) doesn't
+        (
+            Annotated[frozenset, at.Le(frozenset({1, 2}))],
+            [frozenset({1}), frozenset({3})],
+            1,
+            at.Le(frozenset({1, 2})),
+        ),
+        (Annotated[float, at.MultipleOf(0.5)], [1, 1.5, 0.25], 2, at.MultipleOf(0.5)),
+    ],
+)
+def test_numeric_element_constraints(element, invalid, index, constraint):
+    annotation = List[element]
+    assert annotated_type_lookup(list, (element,), ()) is not None
+    check_all_items(invalid[:index], annotation)
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_all_items(invalid, annotation)
+    assert exc_info.value.index == index
+    assert exc_info.value.constraint == constraint
+
+
+@pytest.mark.parametrize(
+    "marker, valid, invalid, index",
+    [
+        (at.LowerCase, ["abc", "foo bar"], ["abc", "A"], 1),
+        (at.UpperCase, ["ABC", "DEF"], ["ABC", "DEF", "abc"], 2),
+        (at.IsDigit, ["123", "0"], ["", "12"], 0),
+        (at.IsAscii, ["123", "foo bar"], ["ok", "£100", "😊"], 1),
+    ],
+)
+def test_string_predicate_lists(marker, valid, invalid, index):
+    annotation = List[marker[str]]
+    check_all_items(valid, annotation)
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_all_items(invalid, annotation)
+    assert exc_info.value.index == index
+
+
+@pytest.mark.parametrize("element_type", [bytes, bytearray])
+def test_bytes_elements_use_their_own_methods(element_type):
+    annotation = List[at.IsAscii[element_type]]
+    check_all_items([element_type(b"abc"), element_type(b"123")], annotation)
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_all_items([element_type(b"abc"), element_type(b"\xff")], annotation)
+    assert exc_info.value.index == 1
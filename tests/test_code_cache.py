@@ -0,0 +1,87 @@
+import annotated_types as at
+import pytest
+from typeguard import TypeCheckError
+
+from typeguard_annotatedtypes_plugin import code_cache, resolve_constraints
+from typeguard_annotatedtypes_plugin.compiler import _build
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    code_cache.cache_clear()
+    code_cache.use_disk_cache(tmp_path)
+    yield tmp_path / code_cache.VERSION_TAG
+    code_cache.use_disk_cache(None)
+
+
+def build(*constraints):
+    return _build(int, resolve_constraints(int, (), constraints))
+
+
+def refuse_to_compile(*args):
+    raise AssertionError("compiled instead of loading from the cache")
+
+
+def test_compiled_code_is_reused(cache_dir, monkeypatch):
+    build(at.Ge(0), at.Lt(10))
+    (entry,) = cache_dir.iterdir()
+    assert entry.suffix == ".marshal"
+    code_cache.cache_clear()
+    monkeypatch.setattr(code_cache, "compile", refuse_to_compile, raising=False)
+    # Same structure, other values: the constants are bound at call time
+    validator = build(at.Ge(5), at.Lt(7))
+    assert validator(6, int)
+    with pytest.raises(TypeCheckError):
+        validator(4, int)
+
+
+def test_lambda_predicates(cache_dir, monkeypatch):
+    build(at.Predicate(lambda value: value > 0))
+    code_cache.cache_clear()
+    monkeypatch.setattr(code_cache, "compile", refuse_to_compile, raising=False)
+    validator = build(at.Predicate(lambda value: value % 2 == 0))
+    assert validator(2, int)
+    with pytest.raises(TypeCheckError):
+        validator(3, int)
+
+
+def test_unreadable_entries_are_rewritten(cache_dir):
+    build(at.Ge(0))
+    (entry,) = cache_dir.iterdir()
+    entry.write_bytes(b"not marshal data")
+    code_cache.cache_clear()
+    assert build(at.Ge(0))(1, int)
+    assert entry.read_bytes() != b"not marshal data"
+
+
+def test_shapes_compile_once_per_process(monkeypatch):
+    build(at.Ge(0), at.Lt(100))
+    monkeypatch.setattr(code_cache, "compile", refuse_to_compile, raising=False)
+    validator = build(at.Ge(1), at.Lt(50))
+    assert validator(1, int)
+    with pytest.raises(TypeCheckError):
+        validator(50, int)
+
+
+def test_process_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(code_cache, "COMPILED_MAXSIZE", 2)
+    code_cache.cache_clear()
+    for constraints in ((at.Ge(0),), (at.Ge(0), at.Lt(1)), (at.MultipleOf(2),)):
+        build(*constraints)
+    assert len(code_cache._COMPILED) == 2
+
+
+def test_versions_are_kept_apart(tmp_path):
+    assert code_cache.VERSION_TAG.startswith(f"v{code_cache.CACHE_FORMAT}-")
+    assert "-at" in code_cache.VERSION_TAG and "-plugin" in code_cache.VERSION_TAG
+    code_cache.use_disk_cache(tmp_path)
+    try:
+        assert code_cache.CACHE_DIR == tmp_path / code_cache.VERSION_TAG
+    finally:
+        code_cache.use_disk_cache(None)
+
+
+def test_disabled_by_default(tmp_path):
+    assert code_cache.CACHE_DIR is None
+    build(at.Gt(0))
+    assert not any(tmp_path.iterdir())
@@ -0,0 +1,68 @@
+import re
+from datetime import datetime
+from typing import Annotated
+
+import annotated_types as at
+import pytest
+import typeguard
+from typeguard import check_type
+
+from typeguard_annotatedtypes_plugin import (
+    check_ge,
+    check_lt,
+    check_timezone,
+    use_compiled_validators,
+)
+from typeguard_annotatedtypes_plugin.compiler import compile_constraints
+
+BOUNDS = ((check_ge.__wrapped__, at.Ge(0)), (check_lt.__wrapped__, at.Lt(100)))
+
+
+@pytest.fixture
+def compiled():
+    use_compiled_validators()
+    yield
+    use_compiled_validators(False)
+
+
+def test_source_inlines_bound_values():
+    validator = compile_constraints(int, BOUNDS)
+    assert "value >= _b0" in validator.__source__
+    assert "value < _b1" in validator.__source__
+    assert validator.__closure__ is not None
+
+
+def test_compiled_validator_is_cached():
+    assert compile_constraints(int, BOUNDS) is compile_constraints(int, BOUNDS)
+
+
+def test_generic_checker_is_called_through_closure():
+    validator = compile_constraints(
+        datetime, ((check_timezone.__wrapped__, at.Timezone(None)),)
+    )
+    assert "_k0(value, origin_type, args, memo, _c0)" in validator.__source__
+    assert validator(datetime(2000, 1, 1))
+
+
+@pytest.mark.parametrize(
+    "value, match",
+    [
+        (-1, "with value=-1 failed Ge(ge=0)"),
+        (100, "with value=100 failed Lt(lt=100)"),
+        ("hi", "'hi' is not an instance of int"),
+    ],
+)
+def test_failures_report_the_failing_constraint(value, match):
+    validator = compile_constraints(int, BOUNDS)
+    assert validator(50)
+    with pytest.raises(typeguard.TypeCheckError, match=re.escape(match)):
+        validator(value, int, (), None)
+
+
+def test_check_type_uses_compiled_validator(compiled):
+    annotation = Annotated[int, at.Ge(0), at.Predicate(lambda x: x % 2 == 0)]
+    check_type(4, annotation)
+    with pytest.raises(typeguard.TypeCheckError, match="failed Predicate"):
+        check_type(3, annotation)
+    with pytest.raises(typeguard.TypeCheckError, match="failed Ge"):
+        check_type(-2, annotation)
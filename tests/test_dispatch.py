@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from typing import Annotated
+
+import annotated_types as at
+import pytest
+import typeguard
+from typeguard import typechecked
+
+from typeguard_annotatedtypes_plugin import (
+    check_ge,
+    check_len,
+    match_annotated_type,
+    resolve_checker,
+)
+
+
+@dataclass(frozen=True)
+class NonNegative(at.Ge):
+    ge: int = 0
+
+
+def test_resolves_exact_constraint_class():
+    assert resolve_checker(at.Ge) is check_ge
+    assert resolve_checker(slice) is check_len
+
+
+def test_resolves_subclass_over_mro():
+    assert resolve_checker(NonNegative) is check_ge
+
+
+def test_unhandled_constraint_resolves_to_none():
+    assert resolve_checker(at.Unit) is None
+    assert resolve_checker(str) is None
+
+
+def test_skips_unhandled_extras():
+    constraint = at.Ge(0)
+    assert match_annotated_type(int, at.doc("x"), "comment", constraint) == (
+        (constraint, check_ge),
+    )
+    assert match_annotated_type(int, at.doc("x"), at.Unit("m")) is None
+
+
+@typechecked
+def expects_non_negative(value: Annotated[int, NonNegative()]) -> None:
+    pass
+
+
+def test_constraint_subclass_is_checked():
+    expects_non_negative(0)
+    with pytest.raises(typeguard.TypeCheckError, match="failed NonNegative"):
+        expects_non_negative(-1)
@@ -0,0 +1,75 @@
+import copy
+import pickle
+from typing import Annotated, List
+
+import annotated_types as at
+import pytest
+from typeguard import CollectionCheckStrategy, TypeCheckError, check_type
+
+from typeguard_annotatedtypes_plugin import ConstraintViolation, set_repr_limits
+from typeguard_annotatedtypes_plugin.errors import REPR
+
+
+@pytest.fixture
+def repr_limits():
+    saved = vars(REPR).copy()
+    yield
+    vars(REPR).update(saved)
+
+
+def test_violation_keeps_value_constraint_and_origin_type():
+    value = "x" * 5
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_type(value, Annotated[str, at.MaxLen(3)])
+    error = exc_info.value
+    assert isinstance(error, TypeCheckError)
+    assert error.value is value
+    assert error.constraint == at.MaxLen(3)
+    assert error.origin_type is str
+
+
+def test_huge_values_are_truncated_in_message():
+    value = "x" * 2_000_000
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_type(value, Annotated[str, at.MaxLen(3)])
+    message = str(exc_info.value)
+    assert len(message) < 300
+    assert message.endswith("failed MaxLen(max_length=3)")
+
+
+def test_huge_lists_are_truncated_in_message():
+    with pytest.raises(ConstraintViolation, match=r"\[0, 1, .*\.\.\.\] failed") as e:
+        check_type(list(range(500_000)), Annotated[List[int], at.MaxLen(3)])
+    assert len(str(e.value)) < 300
+
+
+def test_message_is_rendered_lazily(repr_limits):
+    error = ConstraintViolation("abcdef", str, at.MaxLen(3))
+    set_repr_limits(maxstring=5)
+    assert str(error) == "with value='...' failed MaxLen(max_length=3)"
+
+
+def test_unknown_repr_limit_is_rejected():
+    with pytest.raises(TypeError, match="maxstrings"):
+        set_repr_limits(maxstrings=5)
+
+
+@pytest.mark.parametrize(
+    "roundtrip", [copy.copy, lambda e: pickle.loads(pickle.dumps(e))]
+)
+def test_violation_survives_pickle_and_copy(roundtrip):
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_type(
+            [1, -1],
+            List[Annotated[int, at.Ge(0)]],
+            collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS,
+        )
+    original = exc_info.value
+    error = roundtrip(original)
+    assert type(error) is ConstraintViolation
+    fields = ("value", "origin_type", "constraint", "error", "index")
+    assert [getattr(error, f) for f in fields] == [getattr(original, f) for f in fields]
+    assert error.constraint == at.Ge(0)
+    # Includes the path typeguard appended
+    assert str(error) == str(original)
+    assert str(error).startswith("list ")
@@ -0,0 +1,73 @@
+from typing import Annotated, Dict, Iterator, List
+
+import annotated_types as at
+import pytest
+import typeguard
+from typeguard import check_type
+
+from typeguard_annotatedtypes_plugin import expand_grouped_metadata
+
+
+class IntegralFloat(at.GroupedMetadata):
+    def __init__(self):
+        self.iterations = 0
+
+    def __iter__(self) -> Iterator[at.Predicate]:
+        self.iterations += 1
+        yield at.Predicate(lambda x: float(x).is_integer())
+
+
+class Percentage(at.GroupedMetadata):
+    def __iter__(self) -> Iterator[object]:
+        yield at.Interval(ge=0, le=100)
+        yield IntegralFloat()
+
+
+def test_custom_grouped_metadata_is_iterated_once():
+    grouped = IntegralFloat()
+    annotation = Annotated[float, grouped]
+    for value in (0.0, 2.0, 3.0):
+        check_type(value, annotation)
+    for value in (0.01, 1.5):
+        with pytest.raises(typeguard.TypeCheckError, match="failed Predicate"):
+            check_type(value, annotation)
+    assert grouped.iterations == 1
+
+
+def test_nested_groups_are_flattened():
+    parts = expand_grouped_metadata(Percentage())
+    assert parts[:2] == (at.Ge(0), at.Le(100))
+    assert isinstance(parts[2], at.Predicate)
+
+
+@pytest.mark.parametrize(
+    "annotation, valid_cases, invalid_cases",
+    [
+        (Annotated[str, at.Len(3)], ("123", "x" * 10), ("", "12")),
+        (Annotated[str, at.Len(0, 4)], ("", "1234"), ("12345",)),
+        (Annotated[str, at.Len(3, 3)], ("123",), ("12", "1234")),
+        (Annotated[List[int], at.MinLen(3)], ([1, 2, 3],), ([], [1, 2])),
+        (Annotated[List[str], at.MaxLen(4)], ([], ["a"] * 4), (["a"] * 5,)),
+        (
+            Annotated[Dict[int, int], at.Len(2, 3)],
+            ({1: 1, 2: 2},),
+            ({}, {1: 1, 2: 2, 3: 3, 4: 4}),
+        ),
+    ],
+)
+def test_len(annotation, valid_cases, invalid_cases):
+    for value in valid_cases:
+        check_type(value, annotation)
+    for value in invalid_cases:
+        with pytest.raises(typeguard.TypeCheckError, match="failed M(in|ax)Len"):
+            check_type(value, annotation)
+
+
+@pytest.mark.parametrize(
+    "annotation", [Annotated[List[int], at.MinLen(1)], Annotated[List[int], at.Len(1)]]
+)
+def test_len_still_checks_the_items(annotation):
+    with pytest.raises(
+        typeguard.TypeCheckError, match="item 0 of list is not an instance of int"
+    ):
+        check_type(["a"], annotation)
@@ -0,0 +1,87 @@
+import functools
+import gc
+import math
+import re
+from typing import Annotated, Dict
+
+import annotated_types as at
+import pytest
+from typeguard import (
+    CollectionCheckStrategy,
+    TypeCheckConfiguration,
+    TypeCheckMemo,
+    check_type,
+)
+
+from typeguard_annotatedtypes_plugin import (
+    CHECKERS,
+    AnnotatedAlias,
+    ConstraintViolation,
+    annotated_type_lookup,
+)
+from typeguard_annotatedtypes_plugin.cache import InternTable
+
+ALL_ITEMS = TypeCheckMemo(
+    {},
+    {},
+    config=TypeCheckConfiguration(
+        collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS
+    ),
+)
+
+
+def test_equal_plans_share_one_checker():
+    first = annotated_type_lookup(int, (), (at.Ge(0), at.Le(10)))
+    annotated_type_lookup.cache_clear()
+    second = annotated_type_lookup(float, (), (at.Le(10), at.Ge(0)))
+    assert first is second
+    assert CHECKERS.intern(first.__interned_key__, lambda: None) is first
+
+
+@pytest.mark.parametrize(
+    "first, second", [(at.Gt(-2), at.Gt(-2.0)), (at.Gt(-2.0), at.Gt(-2))]
+)
+def test_equal_plans_spelled_differently_are_kept_apart(first, second):
+    # Built directly: typing's own cache would hand back the first alias
+    check_type(1.0, AnnotatedAlias(float, (first,)))
+    with pytest.raises(ConstraintViolation, match=re.escape(f"failed {second}")):
+        check_type(-3.0, AnnotatedAlias(float, (second,)))
+
+    annotated_type_lookup(list, (AnnotatedAlias(float, (first,)),), ())
+    args = (AnnotatedAlias(float, (second,)),)
+    checker = annotated_type_lookup(list, args, ())
+    with pytest.raises(ConstraintViolation, match=re.escape(f"failed {second}")):
+        checker([-3.0], list, args, ALL_ITEMS)
+
+
+def test_values_are_held_weakly():
+    table = InternTable()
+    value = table.intern(("key",), lambda: functools.partial(print))
+    assert table.intern(("key",), lambda: None) is value
+    assert len(table) == 1
+    del value
+    gc.collect()
+    assert len(table) == 0
+    assert table.intern(("key",), lambda: None) is None
+
+
+def test_unhashable_keys_are_not_interned():
+    table = InternTable()
+    key = (at.Predicate(at.Not(math.isfinite)),)
+    first = table.intern(key, lambda: functools.partial(print))
+    assert table.intern(key, lambda: functools.partial(print)) is not first
+    assert len(table) == 0
+
+
+def test_builds_without_a_value_leave_no_bucket():
+    table = InternTable()
+    for i in range(100):
+        assert table.intern(("key", i), lambda: None) is None
+    assert not table._buckets
+
+
+def test_lookups_without_a_sequence_checker_leave_no_bucket():
+    # Dict arguments take the ("sequence", ...) key, whose build returns None
+    for i in range(200):
+        check_type({"a": 1}, Dict[str, Annotated[int, at.Ge(-i)]])
+    assert all(CHECKERS._buckets.values())
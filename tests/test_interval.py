@@ -0,0 +1,90 @@
+import re
+from datetime import datetime
+from typing import Annotated
+
+import annotated_types as at
+import pytest
+import typeguard
+from typeguard import TypeHintWarning, check_type
+
+from typeguard_annotatedtypes_plugin import check_bounds, normalize_constraints
+from typeguard_annotatedtypes_plugin.bounds import Bounds, merge_bounds
+from typeguard_annotatedtypes_plugin.compiler import compile_constraints
+
+
+@pytest.mark.parametrize(
+    "annotation, valid_cases, invalid_cases",
+    [
+        (Annotated[int, at.Interval(gt=4)], (5, 6, 1000), (4, 0, -1)),
+        (Annotated[int, at.Interval(gt=4, lt=10)], (5, 6), (4, 10, 1000, 0, -1)),
+        (Annotated[float, at.Interval(ge=0.5, le=1.0)], (0.5, 0.9, 1.0), (0.49, 1.1)),
+        (
+            Annotated[
+                datetime, at.Interval(gt=datetime(2000, 1, 1), le=datetime(2000, 1, 3))
+            ],
+            (datetime(2000, 1, 2), datetime(2000, 1, 3)),
+            (datetime(2000, 1, 1), datetime(2000, 1, 4)),
+        ),
+    ],
+)
+def test_interval(annotation, valid_cases, invalid_cases):
+    for value in valid_cases:
+        check_type(value, annotation)
+    for value in invalid_cases:
+        with pytest.raises(typeguard.TypeCheckError):
+            check_type(value, annotation)
+
+
+def test_keeps_tightest_bounds():
+    bounds = merge_bounds([at.Ge(0), at.Gt(0), at.Ge(-5), at.Lt(10), at.Le(3)])
+    assert bounds == Bounds(at.Gt(0), at.Le(3))
+    assert (bounds.lower, bounds.lower_inclusive) == (0, False)
+    assert (bounds.upper, bounds.upper_inclusive) == (3, True)
+
+
+def test_incomparable_bounds_are_not_merged():
+    assert merge_bounds([at.Ge(0), at.Lt("z")]) is None
+
+
+def test_bounds_and_interval_collapse_into_one_check():
+    annotation = Annotated[int, at.Ge(0), at.MultipleOf(2), at.Interval(lt=10)]
+    check_type(4, annotation)
+    for value, failed in ((-2, "Ge(ge=0)"), (12, "Lt(lt=10)"), (3, "MultipleOf")):
+        with pytest.raises(typeguard.TypeCheckError, match=re.escape(failed)):
+            check_type(value, annotation)
+
+
+def test_normalized_constraints_keep_position_of_first_bound():
+    constraints = (
+        ("multiple_of", at.MultipleOf(2)),
+        ("ge", at.Ge(0)),
+        ("lt", at.Lt(10)),
+    )
+    assert normalize_constraints(constraints) == (
+        ("multiple_of", at.MultipleOf(2)),
+        (check_bounds.__wrapped__, Bounds(at.Ge(0), at.Lt(10))),
+    )
+
+
+def test_unsatisfiable_range_warns_at_lookup():
+    annotation = Annotated[int, at.Gt(7), at.Lt(7)]
+    with pytest.warns(TypeHintWarning, match="unsatisfiable") as record:
+        with pytest.raises(typeguard.TypeCheckError):
+            check_type(7, annotation)
+    # Names the annotation and points at the check, not into the plugin
+    assert "Annotated[int, Gt(gt=7), Lt(lt=7)]" in str(record[0].message)
+    assert record[0].filename == __file__
+    bounds = merge_bounds([at.Gt(5), at.Lt(5)])
+    assert not bounds.satisfiable
+    assert not bounds.contains(5)
+    assert bounds.violated_by(5) == at.Gt(5)
+    assert bounds.violated_by(6) == at.Lt(5)
+
+
+def test_compiled_bounds_are_a_chained_comparison():
+    bounds = Bounds(at.Ge(0), at.Lt(100))
+    validator = compile_constraints(int, ((check_bounds.__wrapped__, bounds),))
+    assert "_lo0 <= value < _hi0" in validator.__source__
+    assert validator(0)
+    with pytest.raises(typeguard.TypeCheckError, match=re.escape("failed Lt(lt=100)")):
+        validator(100, int, (), None)
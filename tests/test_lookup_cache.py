@@ -0,0 +1,95 @@
+import math
+from typing import Annotated
+
+import annotated_types as at
+import pytest
+import typeguard
+from typeguard import typechecked
+
+from typeguard_annotatedtypes_plugin import annotated_type_lookup
+from typeguard_annotatedtypes_plugin.cache import lookup_cache
+
+
+def _make_lookup(maxsize):
+    calls = []
+
+    @lookup_cache(maxsize=maxsize)
+    def lookup(origin_type, args, extras):
+        calls.append((origin_type, args, extras))
+        return extras or None
+
+    return lookup, calls
+
+
+def test_repeated_lookup_is_a_hit():
+    lookup, calls = _make_lookup(maxsize=4)
+    assert lookup(int, (), (at.Ge(0),)) == (at.Ge(0),)
+    assert lookup(int, (), (at.Ge(0),)) == (at.Ge(0),)
+    assert len(calls) == 1
+    info = lookup.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_none_results_are_cached():
+    lookup, calls = _make_lookup(maxsize=4)
+    assert lookup(int, (), ()) is None
+    assert lookup(int, (), ()) is None
+    assert len(calls) == 1
+
+
+def test_least_recently_used_is_evicted():
+    lookup, calls = _make_lookup(maxsize=2)
+    lookup(int, (), (at.Ge(0),))
+    lookup(int, (), (at.Ge(1),))
+    lookup(int, (), (at.Ge(0),))  # refresh Ge(0)
+    lookup(int, (), (at.Ge(2),))  # evicts Ge(1)
+    assert lookup.cache_info().evictions == 1
+    lookup(int, (), (at.Ge(0),))
+    assert len(calls) == 3
+    lookup(int, (), (at.Ge(1),))
+    assert len(calls) == 4
+
+
+def test_unhashable_extras_bypass_the_cache():
+    lookup, calls = _make_lookup(maxsize=2)
+    extras = (at.Predicate(at.Not(math.isfinite)),)
+    lookup(float, (), extras)
+    lookup(float, (), extras)
+    assert len(calls) == 2
+    info = lookup.cache_info()
+    assert (info.uncacheable, info.currsize) == (2, 0)
+
+
+def test_cache_clear():
+    lookup, calls = _make_lookup(maxsize=2)
+    lookup(int, (), (at.Ge(0),))
+    lookup.cache_clear()
+    assert lookup.cache_info() == (0, 0, 0, 0, 2, 0)
+    lookup(int, (), (at.Ge(0),))
+    assert len(calls) == 2
+
+
+Ge0 = Annotated[int, at.Ge(0)]
+
+
+@typechecked
+def expects_ge0(value: Ge0) -> None:
+    pass
+
+
+def test_plugin_lookup_is_cached():
+    annotated_type_lookup.cache_clear()
+    expects_ge0(1)
+    expects_ge0(2)
+    with pytest.raises(typeguard.TypeCheckError):
+        expects_ge0(-1)
+    assert annotated_type_lookup.cache_info().hits >= 2
+
+
+def test_equal_keys_spelled_differently_are_recomputed():
+    lookup, calls = _make_lookup(maxsize=4)
+    assert lookup(int, (), (at.Gt(-2),)) == (at.Gt(-2),)
+    assert repr(lookup(int, (), (at.Gt(-2.0),))) == "(Gt(gt=-2.0),)"
+    assert repr(lookup(int, (), (at.Gt(-2.0),))) == "(Gt(gt=-2.0),)"
+    assert len(calls) == 2
+    assert lookup.cache_info().currsize == 1
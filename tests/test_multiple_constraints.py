@@ -0,0 +1,67 @@
+import re
+from typing import Annotated, Dict, List
+
+import annotated_types as at
+import pytest
+import typeguard
+from typeguard import typechecked
+
+Bounded5 = Annotated[int, at.Ge(0), at.Lt(100), at.MultipleOf(5)]
+
+
+@typechecked
+def expects_bounded5(value: Bounded5) -> None:
+    pass
+
+
+@pytest.mark.parametrize("valid_case", [0, 5, 50, 95])
+def test_Bounded5_accepts_valid_value(valid_case):
+    expects_bounded5(valid_case)
+
+
+@pytest.mark.parametrize(
+    "invalid_case",
+    [
+        dict(value=-5, match="with value=-5 failed Ge(ge=0)"),
+        dict(value=100, match="with value=100 failed Lt(lt=100)"),
+        dict(value=7, match="with value=7 failed MultipleOf(multiple_of=5)"),
+        dict(value="hi", match="'hi' is not an instance of int"),
+    ],
+)
+def test_Bounded5_raises_TypeCheckError(invalid_case):
+    with pytest.raises(
+        typeguard.TypeCheckError, match=re.escape(invalid_case["match"])
+    ):
+        expects_bounded5(invalid_case["value"])
+
+
+@typechecked
+def expects_even_positive(
+    value: Annotated[int, at.Gt(0), at.Predicate(lambda x: x % 2 == 0)],
+) -> None:
+    pass
+
+
+def test_predicate_is_checked_alongside_bounds():
+    expects_even_positive(2)
+    with pytest.raises(typeguard.TypeCheckError, match="failed Gt"):
+        expects_even_positive(-2)
+    with pytest.raises(typeguard.TypeCheckError, match="failed Predicate"):
+        expects_even_positive(3)
+
+
+@pytest.mark.parametrize(
+    "annotation, valid, invalid, match",
+    [
+        (Annotated[List[int], at.Predicate(bool)], [1], ["a"], "item 0 of list"),
+        (Annotated[Dict[str, int], at.Predicate(bool)], {"a": 1}, {"a": "x"}, "'a'"),
+        (Annotated[List[int], at.Predicate(bool)], [1], [], "failed Predicate"),
+    ],
+)
+def test_generic_origins_keep_their_type_argument_checks(
+    annotation, valid, invalid, match
+):
+    # The plugin replaces typeguard's checker and must not check any less
+    typeguard.check_type(valid, annotation)
+    with pytest.raises(typeguard.TypeCheckError, match=match):
+        typeguard.check_type(invalid, annotation)
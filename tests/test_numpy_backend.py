@@ -0,0 +1,85 @@
+import math
+from typing import Annotated
+
+import annotated_types as at
+import pytest
+from typeguard import check_type
+
+from typeguard_annotatedtypes_plugin import ConstraintViolation
+
+np = pytest.importorskip("numpy")
+
+UnitInterval = Annotated[np.ndarray, at.Gt(0), at.Le(1)]
+
+
+def test_bounds_pass():
+    check_type(np.linspace(0.1, 1, 1000), UnitInterval)
+    check_type(np.empty(0), UnitInterval)
+
+
+@pytest.mark.parametrize(
+    "value, index, failed",
+    [
+        (np.array([0.5, 0.0, 2.0]), 1, "Gt(gt=0)"),
+        (np.array([0.5, 1.5, 0.0]), 1, "Le(le=1)"),
+        (np.array([0.5, math.nan]), 1, "Gt(gt=0)"),
+    ],
+)
+def test_bounds_report_first_offending_index(value, index, failed):
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_type(value, UnitInterval)
+    assert exc_info.value.index == index
+    assert str(exc_info.value).endswith(f"failed {failed}")
+
+
+def test_multidimensional_index():
+    value = np.full((3, 4), 0.5)
+    value[2, 1] = 7
+    with pytest.raises(ConstraintViolation, match=r"value\[\(2, 1\)\]=.*7\.0"):
+        check_type(value, UnitInterval)
+
+
+def test_multiple_of():
+    annotation = Annotated[np.ndarray, at.MultipleOf(3)]
+    check_type(np.arange(0, 30, 3), annotation)
+    with pytest.raises(ConstraintViolation, match=r"value\[1\]=.*4.* failed"):
+        check_type(np.array([3, 4, 5]), annotation)
+
+
+@pytest.mark.parametrize(
+    "marker, valid, invalid",
+    [
+        (at.IsFinite, [1.0, -2.0], [1.0, math.inf]),
+        (at.IsNotFinite, [math.nan, math.inf], [math.inf, 1.0]),
+        (at.IsNan, [math.nan], [math.nan, 1.0]),
+        (at.IsNotNan, [1.0, math.inf], [1.0, math.nan]),
+        (at.IsInfinite, [math.inf, -math.inf], [math.inf, math.nan]),
+        (at.IsNotInfinite, [math.nan, 1.0], [1.0, -math.inf]),
+    ],
+)
+def test_float_class_markers(marker, valid, invalid):
+    annotation = marker[np.ndarray]
+    check_type(np.array(valid), annotation)
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_type(np.array(invalid), annotation)
+    assert exc_info.value.index == 1
+
+
+def test_len_applies_to_the_array():
+    annotation = Annotated[np.ndarray, at.Len(2, 3)]
+    check_type(np.zeros(2), annotation)
+    with pytest.raises(ConstraintViolation, match="failed MaxLen"):
+        check_type(np.zeros(4), annotation)
+
+
+def test_generic_predicate_gets_the_whole_array():
+    annotation = Annotated[np.ndarray, at.Predicate(lambda a: a % 2 == 0)]
+    check_type(np.array([2, 4]), annotation)
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_type(np.array([2, 4, 5]), annotation)
+    assert exc_info.value.index == 2
+
+
+def test_non_arrays_are_rejected():
+    with pytest.raises(ConstraintViolation, match="is not an instance of ndarray"):
+        check_type([0.5], UnitInterval)
@@ -0,0 +1,87 @@
+import math
+from typing import Annotated, List
+
+import annotated_types as at
+import pytest
+from typeguard import CollectionCheckStrategy, check_type
+
+from typeguard_annotatedtypes_plugin import ConstraintViolation
+from typeguard_annotatedtypes_plugin.parallel import (
+    PROBE_SIZE,
+    use_parallel_validation,
+)
+
+SIZE = 4 * PROBE_SIZE
+
+
+def check_all_items(value, annotation):
+    return check_type(
+        value, annotation, collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS
+    )
+
+
+@pytest.fixture(params=["thread", "process"])
+def mode(request):
+    use_parallel_validation(request.param, max_workers=2, min_size=PROBE_SIZE)
+    yield request.param
+    use_parallel_validation(None)
+
+
+def test_valid(mode):
+    check_all_items([1.0] * SIZE, List[at.IsFinite[float]])
+
+
+@pytest.mark.parametrize("index", [0, PROBE_SIZE - 1, PROBE_SIZE, SIZE - 1])
+def test_failure_index(mode, index):
+    values = [1.0] * SIZE
+    values[index] = math.inf
+    if index + 1 < SIZE:
+        values[-1] = math.nan
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_all_items(values, List[at.IsFinite[float]])
+    assert exc_info.value.index == index
+
+
+def test_lowest_index_across_constraints(mode):
+    values = ["abc"] * SIZE
+    values[SIZE - 10] = "ABC"
+    values[PROBE_SIZE + 10] = "£"
+    values[SIZE - 5] = 1
+    with pytest.raises(ConstraintViolation, match="failed Predicate") as exc_info:
+        check_all_items(
+            values,
+            List[Annotated[str, at.Predicate(str.islower), at.Predicate(str.isascii)]],
+        )
+    assert exc_info.value.index == PROBE_SIZE + 10
+
+
+@pytest.mark.parametrize("index", [PROBE_SIZE - 1, SIZE - 1])
+def test_bounded_numbers(mode, index):
+    values = [0.5] * SIZE
+    values[index] = 1.5
+    with pytest.raises(ConstraintViolation, match=r"failed Le\(le=1\)") as exc_info:
+        check_all_items(values, List[Annotated[float, at.Ge(0), at.Le(1)]])
+    assert exc_info.value.index == index
+
+
+def test_element_type_failure(mode):
+    values = [1.0] * SIZE
+    values[-1] = "x"
+    with pytest.raises(ConstraintViolation, match="is not an instance of float"):
+        check_all_items(values, List[at.IsFinite[float]])
+
+
+def test_unpicklable_element_type_falls_back_to_threads(mode):
+    class Name(str):
+        pass
+
+    values = [Name("abc")] * SIZE
+    values[-1] = Name("ABC")
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_all_items(values, List[at.LowerCase[Name]])
+    assert exc_info.value.index == SIZE - 1
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError, match="Unknown mode"):
+        use_parallel_validation("gpu")
@@ -0,0 +1,25 @@
+from typing import Dict, List, Optional
+
+import annotated_types as at
+from typeguard import check_type, checker_lookup_functions
+
+from typeguard_annotatedtypes_plugin import annotated_type_lookup, plugin_lookup
+
+
+def test_plugin_lookup_is_registered_first():
+    assert checker_lookup_functions[0] is plugin_lookup
+
+
+def test_rejects_without_reaching_annotated_type_lookup():
+    annotated_type_lookup.cache_clear()
+    assert plugin_lookup(int, (), ()) is None
+    assert plugin_lookup(list, (str,), ()) is None
+    assert plugin_lookup(dict, (str, int), ()) is None
+    check_type({"a": [1]}, Dict[str, List[Optional[int]]])
+    info = annotated_type_lookup.cache_info()
+    assert info.hits + info.misses + info.uncacheable == 0
+
+
+def test_forwards_annotated_metadata():
+    assert plugin_lookup(int, (), (at.Ge(0),)) is not None
+    assert plugin_lookup(int, (), (at.doc("x"),)) is None
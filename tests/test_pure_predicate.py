@@ -0,0 +1,56 @@
+from typing import Annotated
+
+import annotated_types as at
+import pytest
+from typeguard import TypeCheckError, check_type
+
+from typeguard_annotatedtypes_plugin import pure_predicate
+
+calls = []
+
+
+@pure_predicate(maxsize=2)
+def is_glob(path) -> bool:
+    calls.append(path)
+    return "*" in path or "?" in path
+
+
+TGlob = Annotated[object, at.Predicate(is_glob)]
+
+
+@pytest.fixture(autouse=True)
+def clear():
+    is_glob.cache_clear()
+    calls.clear()
+
+
+def test_results_are_memoized():
+    for _ in range(3):
+        check_type("*.py", TGlob)
+        with pytest.raises(TypeCheckError):
+            check_type("setup.py", TGlob)
+    assert calls == ["*.py", "setup.py"]
+    info = is_glob.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (4, 2, 2)
+    assert info.hit_rate == pytest.approx(4 / 6)
+
+
+def test_cache_is_bounded():
+    for path in ["a*", "b*", "c*", "a*"]:
+        check_type(path, TGlob)
+    assert calls == ["a*", "b*", "c*", "a*"]
+    assert is_glob.cache_info().evictions == 2
+
+
+def test_unhashable_values_bypass_the_cache():
+    for _ in range(2):
+        check_type(["*"], TGlob)
+    assert calls == [["*"], ["*"]]
+    assert is_glob.cache_info().uncacheable == 2
+
+
+def test_values_are_keyed_with_their_type():
+    is_one = pure_predicate(lambda value: value is True)
+    assert is_one(True)
+    assert not is_one(1)
+    assert is_one.cache_info().misses == 2
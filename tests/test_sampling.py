@@ -0,0 +1,118 @@
+import math
+from typing import Annotated, List
+
+import annotated_types as at
+import pytest
+from typeguard import CollectionCheckStrategy, check_type
+
+from typeguard_annotatedtypes_plugin import ConstraintViolation, Sample, use_sampling
+
+Finite = at.IsFinite[float]
+
+
+@pytest.fixture
+def values():
+    values = [1.0] * 1000
+    values[500] = math.inf
+    return values
+
+
+def test_first(values):
+    check_type(values, Annotated[List[Finite], Sample(first=500)])
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_type(values, Annotated[List[Finite], Sample(first=501)])
+    assert exc_info.value.index == 500
+
+
+def test_random_samples_are_reproducible():
+    sample = Sample(k=10, seed=42)
+    assert list(sample.indices(1000)) == list(sample.indices(1000))
+    assert len(sample.indices(1000)) == 10
+    assert list(Sample(fraction=0.25).indices(10)) == sorted(
+        Sample(fraction=0.25).indices(10)
+    )
+    assert len(Sample(fraction=0.25).indices(10)) == 3
+    assert Sample(k=100).indices(10) == range(10)
+
+
+def test_random_sample_failure_index(values):
+    positions = Sample(k=100, seed=1).indices(len(values))
+    for position in positions:
+        values[position] = math.nan
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_type(values, Annotated[List[Finite], Sample(k=100, seed=1)])
+    assert exc_info.value.index == positions[0]
+
+
+def test_global_sampling(values):
+    use_sampling(Sample(first=10))
+    try:
+        check_type(values, List[Finite])
+        with pytest.raises(ConstraintViolation):
+            check_type(values, Annotated[List[Finite], Sample(fraction=1.0)])
+    finally:
+        use_sampling(None)
+    with pytest.raises(ConstraintViolation):
+        check_type(
+            values,
+            List[Finite],
+            collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS,
+        )
+
+
+def test_first_item_strategy_checks_the_first_element(values):
+    # typeguard's default strategy, as for collections without a bulk checker
+    check_type(values, List[Finite])
+    check_type(values, List[Annotated[float, at.Ge(0)]])
+    with pytest.raises(ConstraintViolation):
+        check_type([math.inf, 1.0], List[Finite])
+
+
+@pytest.mark.parametrize(
+    "element, invalid",
+    [
+        (Annotated[int, at.Ge(0)], -1),
+        (Annotated[int, at.MultipleOf(2)], 3),
+        (Annotated[str, at.MinLen(1)], ""),
+        (Annotated[str, at.MaxLen(2)], "abc"),
+        (Annotated[str, at.Len(1, 2)], ""),
+    ],
+)
+def test_sampled_element_constraints(element, invalid):
+    valid = {int: 0, str: "a"}[element.__origin__]
+    values = [valid] * 10 + [invalid]
+    check_type(values, Annotated[List[element], Sample(first=10)])
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_type(values, Annotated[List[element], Sample(first=11)])
+    assert exc_info.value.index == 10
+
+
+@pytest.mark.parametrize(
+    "annotation",
+    [
+        Annotated[List[Annotated[int, at.Predicate(bool)]], Sample(first=1)],
+        Annotated[List[Annotated[int, at.Ge(0)]], at.MinLen(1), Sample(first=1)],
+        Annotated[List[int], Sample(first=1)],
+        Annotated[int, Sample(first=1)],
+    ],
+)
+def test_samples_that_cannot_be_applied_are_rejected(annotation):
+    with pytest.raises(TypeError, match=r"Sample\(first=1"):
+        check_type([1], annotation)
+
+
+def test_all_items_strategy_checks_everything(values):
+    with pytest.raises(ConstraintViolation):
+        check_type(
+            values,
+            Annotated[List[Finite], Sample(first=10)],
+            collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS,
+        )
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{}, {"first": 1, "k": 1}, {"first": 0}, {"fraction": 1.5}]
+)
+def test_invalid_samples(kwargs):
+    with pytest.raises(ValueError):
+        Sample(**kwargs)
@@ -0,0 +1,108 @@
+import asyncio
+from typing import Annotated
+
+import annotated_types as at
+import pytest
+from typeguard import TypeCheckError
+
+from typeguard_annotatedtypes_plugin.signature import compile_signature
+
+Positive = Annotated[int, at.Gt(0)]
+
+
+@compile_signature
+def func(
+    a: Positive, /, b: Positive = 1, *args: Positive, c: Positive = 2, **kw: Positive
+) -> Positive:
+    return a + b + sum(args) + c + sum(kw.values()) - 100
+
+
+class Node:
+    def __init__(self, depth: int = 0):
+        self.depth = depth
+
+    # "Node" only resolves once the class exists
+    @compile_signature
+    def child(self, depth: Positive) -> "Node":
+        return Node(depth)
+
+    @compile_signature
+    async def async_child(self, depth: Positive) -> "Node":
+        return Node(depth)
+
+
+def test_valid_call():
+    assert func(100, 1, 2, c=3, d=4) == 10
+    assert func(100) == 3
+
+
+@pytest.mark.parametrize(
+    "args, kwargs, message",
+    [
+        ((0,), {}, 'argument "a" (int) with value=0 failed Gt(gt=0)'),
+        ((1, -1), {}, 'argument "b" (int)'),
+        ((1, 1, 1, -5), {}, 'argument "args" (int) with value=-5'),
+        ((1,), {"c": 0}, 'argument "c" (int)'),
+        ((1,), {"d": 0}, 'argument "kw" (int)'),
+        ((1,), {}, "the return value (int) with value=-96 failed Gt(gt=0)"),
+    ],
+)
+def test_invalid_call(args, kwargs, message):
+    with pytest.raises(TypeCheckError) as exc_info:
+        func(*args, **kwargs)
+    assert str(exc_info.value).startswith(message)
+
+
+def test_signature_and_metadata_are_kept():
+    assert func.__name__ == "func"
+    assert "_tg_k0(a, " in func.__source__
+
+
+def test_functions_without_plugin_checkers_are_returned_unchanged():
+    def plain(a: int, b: str) -> None:
+        pass
+
+    assert compile_signature(plain) is plain
+
+
+def test_async_functions():
+    @compile_signature
+    async def double(value: Positive) -> Annotated[int, at.Lt(10)]:
+        return value * 2
+
+    assert asyncio.run(double(2)) == 4
+    with pytest.raises(TypeCheckError, match="the return value"):
+        asyncio.run(double(5))
+    with pytest.raises(TypeCheckError, match='argument "value"'):
+        asyncio.run(double(0))
+
+
+def test_parameters_named_like_builtins_used_by_the_wrapper():
+    @compile_signature
+    def create(
+        type: Annotated[str, at.MinLen(1)], TypeCheckError: Annotated[int, at.Ge(0)] = 0
+    ) -> str:
+        return type
+
+    assert create("x", 1) == "x"
+    with pytest.raises(TypeCheckError, match=r'argument "type" \(str\)'):
+        create("")
+    with pytest.raises(TypeCheckError, match=r'argument "TypeCheckError" \(int\)'):
+        create("x", -1)
+
+
+def test_parameters_named_like_wrapper_internals_are_rejected():
+    def func(_tg_memo: Annotated[int, at.Ge(0)]) -> None:
+        pass
+
+    with pytest.raises(ValueError, match="_tg_memo"):
+        compile_signature(func)
+
+
+def test_forward_references_are_resolved_on_the_first_call():
+    assert Node().child(1).depth == 1
+    assert asyncio.run(Node().async_child(2)).depth == 2
+    with pytest.raises(TypeCheckError, match='argument "depth"'):
+        Node().child(0)
+    with pytest.raises(TypeCheckError, match='argument "depth"'):
+        asyncio.run(Node().async_child(0))
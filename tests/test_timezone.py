@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, List
+
+import annotated_types as at
+import pytest
+from typeguard import CollectionCheckStrategy, TypeCheckError, check_type
+
+from typeguard_annotatedtypes_plugin import (
+    ConstraintViolation,
+    specialized_timezone_checker,
+    timezone_matcher,
+)
+
+zoneinfo = pytest.importorskip("zoneinfo")
+try:
+    LONDON = zoneinfo.ZoneInfo("Europe/London")
+except zoneinfo.ZoneInfoNotFoundError:
+    pytest.skip("no time zone data", allow_module_level=True)
+
+NAIVE = datetime(2000, 1, 1)
+UTC = datetime(2000, 1, 1, tzinfo=timezone.utc)
+PLUS_6 = datetime(2000, 1, 1, tzinfo=timezone(timedelta(hours=6)))
+NAMED = datetime(2000, 1, 1, tzinfo=timezone(timedelta(0), name="Europe/London"))
+ZONED = datetime(2000, 7, 1, tzinfo=LONDON)
+
+
+@pytest.mark.parametrize(
+    "tz, valid, invalid",
+    [
+        (None, [NAIVE], [UTC, ZONED]),
+        (..., [UTC, PLUS_6, ZONED], [NAIVE]),
+        (timezone.utc, [UTC, NAMED], [NAIVE, PLUS_6]),
+        (LONDON, [ZONED], [NAIVE, UTC, NAMED]),
+        ("Europe/London", [NAMED, ZONED], [NAIVE, UTC, PLUS_6]),
+        ("BST", [ZONED], [NAIVE, datetime(2000, 1, 1, tzinfo=LONDON)]),
+    ],
+)
+def test_timezone(tz, valid, invalid):
+    annotation = Annotated[datetime, at.Timezone(tz)]
+    for value in valid:
+        check_type(value, annotation)
+    for value in invalid:
+        with pytest.raises(TypeCheckError):
+            check_type(value, annotation)
+
+
+def test_matcher_is_prebuilt_per_timezone():
+    assert timezone_matcher("Europe/London") is timezone_matcher("Europe/London")
+    assert timezone_matcher(None)(NAIVE)
+
+
+def test_lists_of_datetimes():
+    annotation = List[Annotated[datetime, at.Timezone("Europe/London")]]
+    all_items = CollectionCheckStrategy.ALL_ITEMS
+    check_type([ZONED, NAMED] * 100, annotation, collection_check_strategy=all_items)
+    with pytest.raises(ConstraintViolation) as exc_info:
+        check_type(
+            [ZONED] * 100 + [UTC], annotation, collection_check_strategy=all_items
+        )
+    assert exc_info.value.index == 100
+
+
+def test_caches_keyed_on_user_objects_are_bounded():
+    for cached in (timezone_matcher, specialized_timezone_checker):
+        assert cached.cache_info().maxsize is not None
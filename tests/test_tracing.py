@@ -0,0 +1,37 @@
+from typing import Annotated
+
+import annotated_types as at
+from typeguard import check_type
+
+import typeguard_annotatedtypes_plugin as plugin
+from typeguard_annotatedtypes_plugin.util import RingBufferSink
+
+
+def test_tracing_is_disabled_by_default(capsys):
+    assert not hasattr(plugin.match_annotated_type, "__wrapped__")
+    check_type(1, Annotated[int, at.Ge(0)])
+    assert capsys.readouterr().out == ""
+
+
+def test_enabled_tracing_writes_to_sink(capsys):
+    sink = RingBufferSink(maxlen=100)
+    plugin.annotated_type_lookup.cache_clear()
+    plugin.enable_tracing(sink)
+    try:
+        assert plugin.match_annotated_type.__wrapped__ is not None
+        check_type(1, Annotated[int, at.Ge(-7)])
+    finally:
+        plugin.disable_tracing()
+    assert capsys.readouterr().out == ""
+    lines = list(sink.lines)
+    assert lines[0].startswith("➡️  annotated_type_lookup(<class 'int'>")
+    assert any("match_annotated_type" in line for line in lines)
+    assert lines[-1].startswith("⬅️  annotated_type_lookup ==> check_constraints(")
+    assert not hasattr(plugin.match_annotated_type, "__wrapped__")
+
+
+def test_ring_buffer_is_bounded():
+    sink = RingBufferSink(maxlen=2)
+    for line in "abc":
+        sink(line)
+    assert list(sink.lines) == ["b", "c"]
@@ -0,0 +1,101 @@
+import copy
+import gc
+import pickle
+import weakref
+from typing import Annotated
+
+import annotated_types as at
+import pytest
+from typeguard import TypeCheckError, check_type
+
+import typeguard_annotatedtypes_plugin
+from typeguard_annotatedtypes_plugin import (
+    annotated_type_lookup,
+    lookup_owner,
+    use_weak_lookup_cache,
+)
+from typeguard_annotatedtypes_plugin.cache import WEAK_SLOT
+
+SLOTTED = not hasattr(at.Ge(0), "__dict__")
+
+needs_dict = pytest.mark.skipif(SLOTTED, reason="slotted annotated-types constraints")
+
+
+@pytest.fixture(autouse=True)
+def weak_tier():
+    use_weak_lookup_cache(not SLOTTED)
+    yield
+    use_weak_lookup_cache(False)
+
+
+@needs_dict
+def test_results_are_attached_to_the_constraint():
+    limit = at.Le(10)
+    annotation = Annotated[int, at.Ge(0), limit]
+    check_type(5, annotation)
+    check_type(6, annotation)
+    with pytest.raises(TypeCheckError):
+        check_type(11, annotation)
+    info = annotated_type_lookup.weak_cache_info()
+    assert (info.hits, info.misses, info.owners, info.currsize) == (2, 1, 1, 1)
+    assert annotated_type_lookup.cache_info().currsize == 0
+    assert lookup_owner((limit,)) is limit
+
+
+@needs_dict
+def test_results_are_freed_with_the_constraint():
+    limit = at.Le(12345)
+    annotated_type_lookup(int, (), (limit,))
+    owners = annotated_type_lookup.weak_cache_info().owners
+    reference = weakref.ref(limit)
+    del limit
+    gc.collect()
+    assert reference() is None
+    assert annotated_type_lookup.weak_cache_info().owners == owners - 1
+
+
+@needs_dict
+def test_cache_clear():
+    limit = at.Le(10)
+    annotated_type_lookup(int, (), (limit,))
+    annotated_type_lookup.cache_clear()
+    info = annotated_type_lookup.weak_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+
+@needs_dict
+def test_copies_and_pickles_start_empty():
+    limit = at.Le(10)
+    annotated_type_lookup(int, (), (limit,))
+    for clone in (pickle.loads(pickle.dumps(limit)), copy.deepcopy(limit)):
+        assert clone == limit
+        assert not clone.__dict__.get(WEAK_SLOT)
+
+
+@needs_dict
+def test_disabled_tier_uses_the_lru():
+    use_weak_lookup_cache(False)
+    assert lookup_owner((at.Le(10),)) is None
+    annotated_type_lookup(int, (), (at.Le(10),))
+    assert annotated_type_lookup.cache_info().currsize == 1
+
+
+@needs_dict
+def test_shared_constraint_holds_a_bounded_number_of_results():
+    non_negative = at.Ge(0)
+    before = annotated_type_lookup.cache_info()
+    # Limits no other test uses: typing reuses equal `Annotated` aliases
+    for limit in range(1000, 1100):
+        check_type(0, Annotated[int, non_negative, at.Le(limit)])
+    assert len(non_negative.__dict__[WEAK_SLOT]) == 16
+    assert annotated_type_lookup.cache_info().currsize == before.currsize + 84
+    # Annotations past the cap still hit, through the LRU
+    check_type(0, Annotated[int, non_negative, at.Le(1099)])
+    assert annotated_type_lookup.cache_info().hits == before.hits + 1
+
+
+def test_enabling_warns_where_constraints_are_slotted(monkeypatch):
+    monkeypatch.setattr(typeguard_annotatedtypes_plugin, "SLOTTED_CONSTRAINTS", True)
+    with pytest.warns(RuntimeWarning, match="no effect") as record:
+        use_weak_lookup_cache(True)
+    assert record[0].filename == __file__